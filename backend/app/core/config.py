@@ -9,6 +9,8 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     
     DATABASE_URL: str = os.environ.get("DATABASE_URL", "")
+    DB_POOL_SIZE: int = int(os.environ.get("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.environ.get("DB_MAX_OVERFLOW", "20"))
     
     SECRET_KEY: str = os.environ.get("SECRET_KEY", "your-secret-key-change-in-production")
     ALGORITHM: str = "HS256"
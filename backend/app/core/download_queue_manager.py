@@ -2,9 +2,10 @@ import asyncio
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable, Set
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple
 from collections import defaultdict
 import heapq
+import itertools
 import uuid
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -53,8 +54,11 @@ class DownloadQueueManager:
             worker_timeout=worker_timeout
         )
         
-        # Queue management
-        self._task_queue: List[TaskItem] = []
+        # Queue management. Heap entries are (sort_key, sequence, task) so heapq
+        # orders plain tuples and never falls back to comparing TaskItems; the
+        # sequence keeps FIFO order between tasks with equal keys.
+        self._task_queue: List[Tuple[Tuple[int, float], int, TaskItem]] = []
+        self._task_sequence = itertools.count()
         self._queue_lock = asyncio.Lock()
         self._queue_condition = asyncio.Condition(self._queue_lock)
         
@@ -198,7 +202,9 @@ class DownloadQueueManager:
         )
         
         async with self._queue_lock:
-            heapq.heappush(self._task_queue, task_item)
+            heapq.heappush(
+                self._task_queue, (task_item.sort_key, next(self._task_sequence), task_item)
+            )
             self._stats.queued_tasks += 1
             self._stats.total_tasks += 1
             
@@ -229,7 +235,7 @@ class DownloadQueueManager:
         """
         async with self._queue_lock:
             # Check if task is in queue
-            for i, task_item in enumerate(self._task_queue):
+            for i, (_, _, task_item) in enumerate(self._task_queue):
                 if task_item.task_id == task_id:
                     del self._task_queue[i]
                     heapq.heapify(self._task_queue)  # Restore heap property
@@ -301,7 +307,7 @@ class DownloadQueueManager:
         
         # Check queue
         async with self._queue_lock:
-            for task_item in self._task_queue:
+            for _, _, task_item in self._task_queue:
                 if task_item.task_id == task_id:
                     return "queued"
         
@@ -330,6 +336,11 @@ class DownloadQueueManager:
         if callback in self._backpressure_callbacks:
             self._backpressure_callbacks.remove(callback)
     
+    def _set_worker_status(self, worker_info: WorkerInfo, status: WorkerStatus):
+        """Sets a worker's status and tells the coordinator about the change."""
+        worker_info.status = status
+        self.worker_coordinator.update_worker_status(worker_info.worker_id, status)
+    
     async def _start_workers(self):
         """Starts the worker pool."""
         for i in range(self.max_workers):
@@ -365,7 +376,7 @@ class DownloadQueueManager:
         
         # Update worker statuses
         for worker_info in self._workers.values():
-            worker_info.status = WorkerStatus.STOPPED
+            self._set_worker_status(worker_info, WorkerStatus.STOPPED)
         
         self._worker_tasks.clear()
     
@@ -388,16 +399,16 @@ class DownloadQueueManager:
                     break
                 except Exception as e:
                     self.logger.error(f"Worker {worker_id} error: {e}")
-                    worker_info.status = WorkerStatus.ERROR
+                    self._set_worker_status(worker_info, WorkerStatus.ERROR)
                     worker_info.error_message = str(e)
                     await asyncio.sleep(5)  # Brief pause before retrying
-                    worker_info.status = WorkerStatus.IDLE
+                    self._set_worker_status(worker_info, WorkerStatus.IDLE)
                     worker_info.error_message = None
         
         except asyncio.CancelledError:
             pass
         finally:
-            worker_info.status = WorkerStatus.STOPPED
+            self._set_worker_status(worker_info, WorkerStatus.STOPPED)
             worker_info.current_task_id = None
             self.logger.debug(f"Worker {worker_id} stopped")
     
@@ -412,7 +423,7 @@ class DownloadQueueManager:
                 
                 # Check if there are tasks in queue
                 if self._task_queue:
-                    task_item = heapq.heappop(self._task_queue)
+                    _, _, task_item = heapq.heappop(self._task_queue)
                     self._stats.queued_tasks -= 1
                     self._stats.processing_tasks += 1
                     return task_item
@@ -432,7 +443,7 @@ class DownloadQueueManager:
         
         try:
             # Update worker status
-            worker_info.status = WorkerStatus.BUSY
+            self._set_worker_status(worker_info, WorkerStatus.BUSY)
             worker_info.current_task_id = task_id
             worker_info.last_activity = datetime.utcnow()
             
@@ -507,7 +518,7 @@ class DownloadQueueManager:
                 )
             
             # Report completion to worker coordinator
-            await self.worker_coordinator.report_task_completion(
+            self.worker_coordinator.report_task_completion_nowait(
                 task_id, worker_id, success, processing_time
             )
             
@@ -537,7 +548,7 @@ class DownloadQueueManager:
             if task_id in self._active_tasks:
                 del self._active_tasks[task_id]
             
-            worker_info.status = WorkerStatus.IDLE
+            self._set_worker_status(worker_info, WorkerStatus.IDLE)
             worker_info.current_task_id = None
             worker_info.last_activity = datetime.utcnow()
     
@@ -655,7 +666,7 @@ class DownloadQueueManager:
                             self._worker_tasks[worker_id].cancel()
                         
                         # Restart the worker
-                        worker_info.status = WorkerStatus.IDLE
+                        self._set_worker_status(worker_info, WorkerStatus.IDLE)
                         worker_info.current_task_id = None
                         worker_info.error_message = "Restarted due to timeout"
                         
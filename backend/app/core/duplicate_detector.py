@@ -207,6 +207,46 @@ class DuplicateDetector:
                 error_message=str(e)
             )
     
+    def compute_perceptual_hash_sync(
+        self,
+        file_path: str,
+        media_type: str,
+        hash_method: str = 'average'
+    ) -> str:
+        """
+        Synchronous counterpart of compute_perceptual_hash for callers already
+        running on a worker thread.
+        
+        Returns:
+            Hash value, or an empty string if computation fails
+        """
+        try:
+            if media_type == "photo":
+                if not PIL_AVAILABLE or not IMAGEHASH_AVAILABLE:
+                    return ""
+                hash_value = self._compute_image_hash_sync(file_path, hash_method)
+            elif media_type in ["video", "gif"]:
+                if not OPENCV_AVAILABLE:
+                    return ""
+                hash_value = self._compute_video_hash_sync(file_path)
+            else:
+                # Fallback to content hash for other types
+                hash_value = self._compute_content_hash_sync(file_path)
+            return hash_value or ""
+        except Exception as e:
+            self.logger.error(f"Error computing perceptual hash for {file_path}: {e}")
+            return ""
+    
+    @staticmethod
+    def hamming(hash1: bytes, hash2: bytes) -> int:
+        """
+        Hamming distance between two equal-length raw hashes.
+        
+        XORs the hashes as big integers and counts the set bits with
+        int.bit_count(), which CPython implements with a popcount instruction.
+        """
+        return (int.from_bytes(hash1, 'big') ^ int.from_bytes(hash2, 'big')).bit_count()
+    
     async def compare_perceptual_hashes(
         self,
         hash1: str,
@@ -233,17 +273,19 @@ class DuplicateDetector:
                 distance = 0 if hash1 == hash2 else float('inf')
             else:
                 # For perceptual hashes, compute Hamming distance
-                if IMAGEHASH_AVAILABLE:
-                    try:
-                        h1 = imagehash.hex_to_hash(hash1)
-                        h2 = imagehash.hex_to_hash(hash2)
-                        distance = h1 - h2
-                    except ValueError:
-                        # Fallback to string comparison
-                        distance = sum(c1 != c2 for c1, c2 in zip(hash1, hash2))
-                else:
-                    # Simple string comparison fallback
+                try:
+                    b1 = bytes.fromhex(hash1)
+                    b2 = bytes.fromhex(hash2)
+                except ValueError:
+                    # Fallback to string comparison
+                    b1 = b2 = None
+                if b1 is None:
                     distance = sum(c1 != c2 for c1, c2 in zip(hash1, hash2))
+                elif len(b1) != len(b2):
+                    # Hashes of different sizes are not comparable
+                    distance = float('inf')
+                else:
+                    distance = self.hamming(b1, b2)
             
             # Determine similarity level
             similarity_level = SimilarityLevel.NONE
@@ -1,105 +1,325 @@
+import io
 import logging
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
+from typing import Callable
 
 LOGS_DIR = "logs"
-os.makedirs(LOGS_DIR, exist_ok=True)
 
-def setup_logging():
+_initialized = False
+
+_rotation_executor = None
+_rotation_executor_lock = threading.Lock()
+
+
+def _get_rotation_executor() -> ThreadPoolExecutor:
+    """Single worker shared by every handler so rotations serialize off the emit path."""
+    global _rotation_executor
+    if _rotation_executor is None:
+        with _rotation_executor_lock:
+            if _rotation_executor is None:
+                _rotation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-rotation")
+    return _rotation_executor
+
+
+if hasattr(os, "writev"):
+    def _write_line(fd: int, data: bytes, terminator: bytes):
+        os.writev(fd, (data, terminator))
+else:
+    def _write_line(fd: int, data: bytes, terminator: bytes):
+        os.write(fd, data + terminator)
+
+
+class CachingFormatter(logging.Formatter):
+    """Formatter whose format() is a closure over the precompiled style and date format.
+
+    The rendered timestamp is reused for every record emitted within the same second.
+    Records carrying a traceback or stack are assembled in a reusable per-thread
+    buffer instead of by repeated string concatenation.
+    """
+
+    def __init__(self, fmt: str, datefmt: str):
+        super().__init__(fmt, datefmt)
+        self._last_asctime = (None, "")
+        self._tls = threading.local()
+        self.format = self._build_format()
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, asctime = self._last_asctime
+        if cached_second != second:
+            asctime = time.strftime(datefmt or self.datefmt, self.converter(record.created))
+            self._last_asctime = (second, asctime)
+        return asctime
+
+    def _get_buffer(self) -> io.StringIO:
+        """Return this thread's reusable assembly buffer, emptied."""
+        buf = getattr(self._tls, "buf", None)
+        if buf is None:
+            buf = self._tls.buf = io.StringIO()
+        else:
+            buf.seek(0)
+            buf.truncate(0)
+        return buf
+
+    def _build_format(self):
+        fmt = self._style._fmt
+        datefmt = self.datefmt
+        uses_time = self.usesTime()
+        format_time = self.formatTime
+        format_exception = self.formatException
+        format_stack = self.formatStack
+        get_buffer = self._get_buffer
+
+        def format(record, fmt=fmt, datefmt=datefmt, newline="\n"):
+            record.message = record.getMessage()
+            if uses_time:
+                record.asctime = format_time(record, datefmt)
+            s = fmt % record.__dict__
+            if record.exc_info and not record.exc_text:
+                record.exc_text = format_exception(record.exc_info)
+            if not record.exc_text and not record.stack_info:
+                return s
+            buf = get_buffer()
+            buf.write(s)
+            tail = s[-1:]
+            if record.exc_text:
+                if tail != newline:
+                    buf.write(newline)
+                buf.write(record.exc_text)
+                tail = record.exc_text[-1:]
+            if record.stack_info:
+                if tail != newline:
+                    buf.write(newline)
+                buf.write(format_stack(record.stack_info))
+            return buf.getvalue()
+
+        return format
+
+
+# Tab-separated with no padding; use scripts/view-log.sh to align the columns for reading
+FILE_FORMATTER = CachingFormatter(
+    '%(asctime)s\t%(levelname)s\t%(name)s\t%(funcName)s\t%(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+CONSOLE_FORMATTER = CachingFormatter(
+    '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
+    datefmt='%H:%M:%S'
+)
+
+
+class RawAppendHandler(RotatingFileHandler):
+    """Rotating file handler that writes encoded records straight to an O_APPEND fd.
+
+    Skips the TextIOWrapper/BufferedWriter layers of the stdlib handler; the
+    kernel guarantees each os.write lands atomically at the end of the file.
+
+    The file is opened on the first write, so handlers that never log create no file.
+
+    With async_rotation the emitting thread only renames the full file aside and
+    reopens a fresh one; shifting the backup slots happens on a background thread.
+    """
+
+    _OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+    def __init__(self, filename, maxBytes=0, backupCount=0, async_rotation=True):
+        self._fd = None
+        self._size = 0
+        self.async_rotation = async_rotation
+        # Handler that receives a copy of the encoded line for records at or above its level
+        self.mirror = None
+        self._rotation_inflight = threading.Event()
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, delay=True)
+        self._terminator_bytes = self.terminator.encode("utf-8")
+
+    def _open_fd(self) -> int:
+        fd = os.open(self.baseFilename, self._OPEN_FLAGS, 0o644)
+        self._size = os.fstat(fd).st_size
+        return fd
+
+    def emit(self, record):
+        try:
+            data = self.format(record).encode("utf-8", "replace")
+            self._append(data)
+            mirror = self.mirror
+            if mirror is not None and record.levelno >= mirror.level:
+                mirror.append(data)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def append(self, data: bytes):
+        """Write an already formatted and encoded line, rotating first if needed."""
+        self.acquire()
+        try:
+            self._append(data)
+        finally:
+            self.release()
+
+    def _append(self, data: bytes):
+        size = len(data) + len(self._terminator_bytes)
+        if self._fd is None:
+            self._fd = self._open_fd()
+        if self.maxBytes > 0 and self.backupCount > 0 and self._size and self._size + size >= self.maxBytes:
+            self.doRollover()
+        _write_line(self._fd, data, self._terminator_bytes)
+        self._size += size
+
+    def doRollover(self):
+        if self.async_rotation:
+            self._rollover_in_background()
+            return
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._shift_backups(self.baseFilename)
+        self._fd = self._open_fd()
+
+    def _rollover_in_background(self):
+        if self._rotation_inflight.is_set():
+            # Previous rotation still shifting backups; keep appending for now
+            return
+        pending = f"{self.baseFilename}.rotating"
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        os.rename(self.baseFilename, pending)
+        self._fd = self._open_fd()
+        self._rotation_inflight.set()
+        try:
+            _get_rotation_executor().submit(self._run_rotation, pending)
+        except RuntimeError:
+            # Executor already shut down (interpreter exit): rotate inline
+            self._run_rotation(pending)
+
+    def _run_rotation(self, pending: str):
+        try:
+            self._shift_backups(pending)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Log rotation failed for {self.baseFilename}: {e}")
+        finally:
+            self._rotation_inflight.clear()
+
+    def _shift_backups(self, source: str):
+        if self.backupCount > 0:
+            for i in range(self.backupCount - 1, 0, -1):
+                sfn = self.rotation_filename(f"{self.baseFilename}.{i}")
+                dfn = self.rotation_filename(f"{self.baseFilename}.{i + 1}")
+                if os.path.exists(sfn):
+                    if os.path.exists(dfn):
+                        os.remove(dfn)
+                    os.rename(sfn, dfn)
+            dfn = self.rotation_filename(f"{self.baseFilename}.1")
+            if os.path.exists(dfn):
+                os.remove(dfn)
+            self.rotate(source, dfn)
+
+    def close(self):
+        self.acquire()
+        try:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        finally:
+            self.release()
+        super().close()
+
+
+def setup_logging(force: bool = False):
+    global _initialized
+    if _initialized and not force:
+        return
+    _initialized = True
+    os.makedirs(LOGS_DIR, exist_ok=True)
+
+    # None of the formats reference thread/process fields; skip populating them per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
     
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
-    console_format = logging.Formatter(
-        '%(asctime)s | %(levelname)-8s | %(name)s | %(message)s',
-        datefmt='%H:%M:%S'
-    )
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(console_format)
+    console_handler.setFormatter(CONSOLE_FORMATTER)
     root_logger.addHandler(console_handler)
     
-    file_format = logging.Formatter(
-        '%(asctime)s | %(levelname)-8s | %(name)-25s | %(funcName)-20s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    app_handler = RotatingFileHandler(
+    app_handler = RawAppendHandler(
         os.path.join(LOGS_DIR, "app.log"),
         maxBytes=10*1024*1024,
-        backupCount=5,
-        encoding='utf-8'
+        backupCount=5
     )
     app_handler.setLevel(logging.DEBUG)
-    app_handler.setFormatter(file_format)
+    app_handler.setFormatter(FILE_FORMATTER)
     root_logger.addHandler(app_handler)
     
-    error_handler = RotatingFileHandler(
+    error_handler = RawAppendHandler(
         os.path.join(LOGS_DIR, "error.log"),
         maxBytes=10*1024*1024,
-        backupCount=5,
-        encoding='utf-8'
+        backupCount=5
     )
     error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(file_format)
-    root_logger.addHandler(error_handler)
+    # Fed by app_handler with the already formatted line instead of formatting twice
+    app_handler.mirror = error_handler
     
     telegram_logger = logging.getLogger("telegram")
-    telegram_handler = RotatingFileHandler(
+    telegram_handler = RawAppendHandler(
         os.path.join(LOGS_DIR, "telegram.log"),
         maxBytes=10*1024*1024,
-        backupCount=5,
-        encoding='utf-8'
+        backupCount=5
     )
     telegram_handler.setLevel(logging.DEBUG)
-    telegram_handler.setFormatter(file_format)
+    telegram_handler.setFormatter(FILE_FORMATTER)
     telegram_logger.addHandler(telegram_handler)
     
     monitor_logger = logging.getLogger("monitor")
-    monitor_handler = RotatingFileHandler(
+    monitor_handler = RawAppendHandler(
         os.path.join(LOGS_DIR, "monitor.log"),
         maxBytes=10*1024*1024,
-        backupCount=5,
-        encoding='utf-8'
+        backupCount=5
     )
     monitor_handler.setLevel(logging.DEBUG)
-    monitor_handler.setFormatter(file_format)
+    monitor_handler.setFormatter(FILE_FORMATTER)
     monitor_logger.addHandler(monitor_handler)
     
     backfill_logger = logging.getLogger("backfill")
-    backfill_handler = RotatingFileHandler(
+    backfill_handler = RawAppendHandler(
         os.path.join(LOGS_DIR, "backfill.log"),
         maxBytes=10*1024*1024,
-        backupCount=5,
-        encoding='utf-8'
+        backupCount=5
     )
     backfill_handler.setLevel(logging.DEBUG)
-    backfill_handler.setFormatter(file_format)
+    backfill_handler.setFormatter(FILE_FORMATTER)
     backfill_logger.addHandler(backfill_handler)
     
     media_logger = logging.getLogger("media")
-    media_handler = RotatingFileHandler(
+    media_handler = RawAppendHandler(
         os.path.join(LOGS_DIR, "media.log"),
         maxBytes=10*1024*1024,
-        backupCount=5,
-        encoding='utf-8'
+        backupCount=5
     )
     media_handler.setLevel(logging.DEBUG)
-    media_handler.setFormatter(file_format)
+    media_handler.setFormatter(FILE_FORMATTER)
     media_logger.addHandler(media_handler)
     
     detection_logger = logging.getLogger("detection")
-    detection_handler = RotatingFileHandler(
+    detection_handler = RawAppendHandler(
         os.path.join(LOGS_DIR, "detection.log"),
         maxBytes=10*1024*1024,
-        backupCount=5,
-        encoding='utf-8'
+        backupCount=5
     )
     detection_handler.setLevel(logging.DEBUG)
-    detection_handler.setFormatter(file_format)
+    detection_handler.setFormatter(FILE_FORMATTER)
     detection_logger.addHandler(detection_handler)
     
     logging.getLogger("uvicorn").setLevel(logging.WARNING)
@@ -111,5 +331,28 @@ def setup_logging():
     logging.info(f"Log files location: {os.path.abspath(LOGS_DIR)}")
 
 
-def get_logger(name: str) -> logging.Logger:
-    return logging.getLogger(name)
+class LazyLoggerAdapter(logging.LoggerAdapter):
+    """Logger wrapper whose *_lazy methods only build the message when the level is enabled.
+
+    Use it for messages that are expensive to render, e.g.
+    ``logger.debug_lazy(lambda: f"payload {json.dumps(obj)}")``; plain calls should
+    pass %-style arguments so formatting is skipped for filtered records.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        super().__init__(logger, {})
+
+    def process(self, msg, kwargs):
+        return msg, kwargs
+
+    def log_lazy(self, level: int, build_message: Callable[[], str], **kwargs):
+        if self.isEnabledFor(level):
+            self.logger.log(level, build_message(), stacklevel=2, **kwargs)
+
+    def debug_lazy(self, build_message: Callable[[], str], **kwargs):
+        if self.isEnabledFor(logging.DEBUG):
+            self.logger.debug(build_message(), stacklevel=2, **kwargs)
+
+
+def get_logger(name: str) -> LazyLoggerAdapter:
+    return LazyLoggerAdapter(logging.getLogger(name))
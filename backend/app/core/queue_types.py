@@ -7,11 +7,11 @@ between DownloadQueueManager and WorkerCoordinator.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime
 
 
-class TaskPriority(Enum):
+class TaskPriority(int, Enum):
     """Enumeration for task priorities."""
     CRITICAL = 0
     HIGH = 1
@@ -20,7 +20,7 @@ class TaskPriority(Enum):
     BACKGROUND = 4
 
 
-class WorkerStatus(Enum):
+class WorkerStatus(str, Enum):
     """Enumeration for worker statuses."""
     IDLE = "idle"
     BUSY = "busy"
@@ -28,7 +28,7 @@ class WorkerStatus(Enum):
     STOPPED = "stopped"
 
 
-class QueueStatus(Enum):
+class QueueStatus(str, Enum):
     """Enumeration for queue statuses."""
     RUNNING = "running"
     PAUSED = "paused"
@@ -36,7 +36,7 @@ class QueueStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerInfo:
     """Data class for worker information."""
     worker_id: str
@@ -47,9 +47,10 @@ class WorkerInfo:
     last_activity: Optional[datetime] = None
     error_message: Optional[str] = None
     performance_metrics: Dict[str, Any] = field(default_factory=dict)
+    processing_time_avg: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskItem:
     """Data class for queue task items."""
     task_id: str
@@ -62,16 +63,17 @@ class TaskItem:
     assigned_worker: Optional[str] = None
     download_task: Optional[Any] = None  # DownloadTask - avoiding circular import
     retry_count: int = 0
+    # (priority, created timestamp): lower priority number first, then older tasks
+    sort_key: Tuple[int, float] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.sort_key = (self.priority.value, self.created_at.timestamp())
     
     def __lt__(self, other):
-        # Lower priority number = higher priority
-        if self.priority.value != other.priority.value:
-            return self.priority.value < other.priority.value
-        # If same priority, older tasks first
-        return self.created_at < other.created_at
+        return self.sort_key < other.sort_key
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueStatistics:
     """Data class for queue statistics."""
     total_tasks: int = 0
@@ -82,4 +84,8 @@ class QueueStatistics:
     active_workers: int = 0
     queue_status: QueueStatus = QueueStatus.STOPPED
     average_processing_time: float = 0.0
-    success_rate: float = 0.0
\ No newline at end of file
+    success_rate: float = 0.0
+    total_workers: int = 0
+    backlog_size: int = 0
+    throughput_per_minute: float = 0.0
+    estimated_completion_time: Optional[datetime] = None
\ No newline at end of file
@@ -9,17 +9,46 @@ Requirements: 4.1, 4.2, 4.3
 
 import asyncio
 import logging
-from typing import Callable, Any, Optional, TypeVar, Generic
+import random
+import re
+import time
+from collections import OrderedDict
+from typing import Callable, Any, Awaitable, Optional, TypeVar, Generic, Hashable, List, Sequence, Tuple
 from contextlib import asynccontextmanager
+from weakref import WeakSet
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError, PendingRollbackError, InvalidRequestError
-from backend.app.db.database import async_session_maker
+from backend.app.db.database import async_session_maker, readonly_session_maker
 from backend.app.core.logging_config import get_logger
 
+__all__ = [
+    "SessionError",
+    "SessionRecoveryError",
+    "SessionManager",
+    "session_manager",
+    "execute_with_retry",
+    "session_scope",
+    "safe_commit",
+]
+
 logger = get_logger("session_manager")
 
 T = TypeVar('T')
 
+# Retry delays in seconds (0.1 doubling per attempt); later attempts reuse the last entry
+RETRY_BACKOFF_SECONDS = tuple(0.1 * (1 << i) for i in range(8))
+
+# Fraction of random jitter applied to each delay so concurrent retries spread out
+RETRY_BACKOFF_JITTER = 0.1
+
+# Maximum number of cached execute_with_retry results
+RESULT_CACHE_SIZE = 1024
+
+# Error message fragments that mark a SQLAlchemy error as transient
+RECOVERABLE_ERROR_PATTERN = re.compile(
+    r'connection|timeout|deadlock|lock|temporary|retry', re.IGNORECASE
+)
+
 
 class SessionError(Exception):
     """Base exception for session management errors"""
@@ -41,19 +70,31 @@ class SessionManager:
     
     def __init__(self):
         self.logger = logger
-        self._active_sessions = set()
+        # Weak references, so a session that is dropped without cleanup is not counted forever
+        self._active_sessions: WeakSet[AsyncSession] = WeakSet()
+        # cache_key -> (stored at, result), least recently used first. Only touched
+        # between awaits on the event loop, so it needs no lock.
+        self._result_cache: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
         
-    async def create_session(self) -> AsyncSession:
+    async def create_session(self, readonly: bool = False) -> AsyncSession:
         """
         Creates a new database session with proper configuration.
         
+        Args:
+            readonly: Use an AUTOCOMMIT session for read-only work; such
+                sessions have nothing to commit
+        
         Returns:
             AsyncSession: Configured database session
         """
         try:
-            session = async_session_maker()
-            self._active_sessions.add(id(session))
-            self.logger.debug(f"Created new session {id(session)}")
+            if readonly:
+                session = readonly_session_maker()
+                session.info['readonly'] = True
+            else:
+                session = async_session_maker()
+            self._active_sessions.add(session)
+            self.logger.debug("Created new session %s", id(session))
             return session
             
         except Exception as e:
@@ -64,7 +105,10 @@ class SessionManager:
         self, 
         operation: Callable[[AsyncSession], Any], 
         max_retries: int = 3,
-        session: Optional[AsyncSession] = None
+        session: Optional[AsyncSession] = None,
+        readonly: bool = False,
+        cache_key: Optional[Hashable] = None,
+        cache_ttl: float = 0
     ) -> Any:
         """
         Executes database operation with automatic retry on rollback errors.
@@ -73,6 +117,14 @@ class SessionManager:
             operation: Async function that takes a session and returns a result
             max_retries: Maximum number of retry attempts
             session: Optional existing session to use
+            readonly: Run on AUTOCOMMIT sessions and skip the commit; only for
+                operations that do not write
+            cache_key: Key under which to cache the result; calls with the same
+                key within cache_ttl seconds return it without running operation
+            cache_ttl: Seconds a cached result stays valid (0 disables caching)
+            
+        With max_retries=0 and an existing session the retry loop is skipped
+        and the operation runs once on that session (see _execute_once).
             
         Returns:
             Result of the operation
@@ -80,31 +132,53 @@ class SessionManager:
         Raises:
             SessionRecoveryError: If all retry attempts fail
         """
+        use_cache = cache_key is not None and cache_ttl > 0
+        if use_cache:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                stored_at, cached_result = cached
+                if time.monotonic() - stored_at <= cache_ttl:
+                    self._result_cache.move_to_end(cache_key)
+                    return cached_result
+                del self._result_cache[cache_key]
+        
+        if max_retries == 0 and session is not None:
+            result = await self._execute_once(operation, session)
+            if use_cache:
+                self._store_cached_result(cache_key, result)
+            return result
+        
         last_error = None
         current_session = session
+        renew_session = False
         
         for attempt in range(max_retries + 1):
             try:
-                # Create new session if none provided or if we need to recover
-                if current_session is None or (attempt > 0):
+                # Create new session if none provided or the last one failed
+                if current_session is None or renew_session:
                     if current_session:
                         await self._cleanup_session(current_session)
-                    current_session = await self.create_session()
+                    current_session = await self.create_session(readonly)
+                    renew_session = False
                 
                 # Execute the operation
                 result = await operation(current_session)
                 
                 # If we created the session, commit and close it
                 if session is None:
-                    await self.safe_commit(current_session)
+                    if not readonly:
+                        await self.safe_commit(current_session)
                     await self._cleanup_session(current_session)
                 
-                self.logger.debug(f"Operation succeeded on attempt {attempt + 1}")
+                self.logger.debug("Operation succeeded on attempt %d", attempt + 1)
+                if use_cache:
+                    self._store_cached_result(cache_key, result)
                 return result
                 
             except PendingRollbackError as e:
                 last_error = e
-                self.logger.warning(f"PendingRollbackError on attempt {attempt + 1}: {e}")
+                self.logger.warning("PendingRollbackError on attempt %d: %s", attempt + 1, e)
+                # Reuses the session when its rollback succeeds
                 current_session = await self.handle_rollback_error(current_session, e)
                 
             except (SQLAlchemyError, Exception) as e:
@@ -116,13 +190,16 @@ class SessionManager:
                         await current_session.rollback()
                     except Exception as rollback_error:
                         self.logger.error(f"Rollback failed: {rollback_error}")
+                renew_session = True
                 
                 # Don't retry on non-recoverable errors
                 if not self._is_recoverable_error(e):
                     break
                     
                 if attempt < max_retries:
-                    await asyncio.sleep(0.1 * (2 ** attempt))  # Exponential backoff
+                    # Exponential backoff with jitter
+                    delay = RETRY_BACKOFF_SECONDS[min(attempt, len(RETRY_BACKOFF_SECONDS) - 1)]
+                    await asyncio.sleep(delay * (1 + RETRY_BACKOFF_JITTER * (2 * random.random() - 1)))
         
         # Clean up session if we created it
         if session is None and current_session:
@@ -130,25 +207,103 @@ class SessionManager:
         
         raise SessionRecoveryError(f"Operation failed after {max_retries + 1} attempts. Last error: {last_error}")
     
+    async def _execute_once(self, operation: Callable[[AsyncSession], Any], session: AsyncSession) -> Any:
+        """
+        Single attempt on a caller-owned session, without the retry loop.
+        
+        Same outcome as execute_with_retry with max_retries=0: the session is
+        rolled back on failure (a PendingRollbackError goes through
+        handle_rollback_error) and SessionRecoveryError is raised. The caller
+        still owns, commits and closes the session.
+        """
+        try:
+            return await operation(session)
+            
+        except PendingRollbackError as e:
+            self.logger.warning("PendingRollbackError on attempt 1: %s", e)
+            recovered = await self.handle_rollback_error(session, e)
+            if recovered is not session:
+                await self._cleanup_session(recovered)
+            raise SessionRecoveryError(f"Operation failed after 1 attempts. Last error: {e}")
+            
+        except Exception as e:
+            self.logger.error(f"Operation failed on attempt 1: {e}")
+            try:
+                await session.rollback()
+            except Exception as rollback_error:
+                self.logger.error(f"Rollback failed: {rollback_error}")
+            raise SessionRecoveryError(f"Operation failed after 1 attempts. Last error: {e}")
+    
+    async def execute_many(
+        self,
+        operations: Sequence[Callable[[AsyncSession], Awaitable[Any]]],
+        max_retries: int = 3,
+        readonly: bool = False
+    ) -> List[Any]:
+        """
+        Executes several independent operations on a single session.
+        
+        The operations share one connection checkout and transaction, but run
+        one after another: an AsyncSession does not support concurrent
+        statements. A retry re-runs the whole batch.
+        
+        Args:
+            operations: Async functions that each take the session
+            max_retries: Maximum number of retry attempts for the batch
+            readonly: Run on an AUTOCOMMIT session and skip the commit
+            
+        Returns:
+            List of results, in the order of operations
+            
+        Raises:
+            SessionRecoveryError: If all retry attempts fail
+        """
+        async def run_all(session: AsyncSession) -> List[Any]:
+            return [await operation(session) for operation in operations]
+        
+        return await self.execute_with_retry(run_all, max_retries=max_retries, readonly=readonly)
+    
+    def _store_cached_result(self, cache_key: Hashable, result: Any) -> None:
+        """Stores a result in the LRU cache, evicting the oldest entries when full."""
+        self._result_cache[cache_key] = (time.monotonic(), result)
+        self._result_cache.move_to_end(cache_key)
+        while len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+    
+    def invalidate(self, cache_key: Optional[Hashable] = None) -> None:
+        """
+        Drops a cached execute_with_retry result.
+        
+        Args:
+            cache_key: Key to drop; None clears the whole cache
+        """
+        if cache_key is None:
+            self._result_cache.clear()
+        else:
+            self._result_cache.pop(cache_key, None)
+    
     async def handle_rollback_error(self, session: AsyncSession, error: Exception) -> AsyncSession:
         """
-        Handles PendingRollbackError by creating fresh session.
+        Handles PendingRollbackError by rolling back the session.
+        
+        A successful rollback leaves the session usable, so it is returned
+        as is with session.info['retry_gen'] incremented; callers holding it
+        (e.g. inside transaction_scope) can check that counter to notice the
+        reuse. A fresh session is only created when the rollback fails.
         
         Args:
             session: Session with pending rollback
             error: The rollback error that occurred
             
         Returns:
-            New fresh session
+            The rolled back session, or a new fresh session
         """
         # Enhanced session rollback logging
         session_id = id(session) if session else "unknown"
         self.logger.error(
-            f"Session rollback error occurred. "
-            f"Session ID: {session_id}, "
-            f"Error type: {type(error).__name__}, "
-            f"Error message: {error}, "
-            f"Recovery action: Creating fresh session"
+            "Session rollback error occurred. Session ID: %s, Error type: %s, "
+            "Error message: %s, Recovery action: Rolling back session",
+            session_id, type(error).__name__, error
         )
         
         try:
@@ -156,36 +311,38 @@ class SessionManager:
             if session:
                 try:
                     await session.rollback()
-                    self.logger.info(f"Successfully rolled back problematic session {session_id}")
+                    retry_gen = session.info.get('retry_gen', 0) + 1
+                    session.info['retry_gen'] = retry_gen
+                    self.logger.info(
+                        "Successfully rolled back problematic session %s, reusing it (generation %d)",
+                        session_id, retry_gen
+                    )
+                    return session
                 except Exception as rollback_error:
                     self.logger.error(
-                        f"Rollback failed for session {session_id}. "
-                        f"Rollback error: {rollback_error}, "
-                        f"Original error: {error}, "
-                        f"Action: Creating new session anyway"
+                        "Rollback failed for session %s. Rollback error: %s, "
+                        "Original error: %s, Action: Creating new session",
+                        session_id, rollback_error, error
                     )
                 
                 # Clean up the old session
                 await self._cleanup_session(session)
             
-            # Create a fresh session
-            new_session = await self.create_session()
-            new_session_id = id(new_session)
+            # Create a fresh session of the same kind
+            new_session = await self.create_session(
+                bool(session and session.info.get('readonly'))
+            )
             self.logger.info(
-                f"Session recovery completed. "
-                f"Old session: {session_id}, "
-                f"New session: {new_session_id}, "
-                f"Cause: {type(error).__name__}"
+                "Session recovery completed. Old session: %s, New session: %s, Cause: %s",
+                session_id, id(new_session), type(error).__name__
             )
             return new_session
             
         except Exception as e:
             self.logger.error(
-                f"Session recovery failed completely. "
-                f"Original session: {session_id}, "
-                f"Original error: {error}, "
-                f"Recovery error: {e}, "
-                f"Action: Raising SessionRecoveryError"
+                "Session recovery failed completely. Original session: %s, "
+                "Original error: %s, Recovery error: %s, Action: Raising SessionRecoveryError",
+                session_id, error, e
             )
             raise SessionRecoveryError(f"Could not recover from rollback error: {e}")
     
@@ -199,74 +356,58 @@ class SessionManager:
         Returns:
             bool: True if commit succeeded, False otherwise
         """
-        session_id = id(session)
-        
         try:
             await session.commit()
-            self.logger.debug(f"Successfully committed session {session_id}")
+            self.logger.debug("Successfully committed session %s", id(session))
             return True
             
-        except PendingRollbackError as e:
-            self.logger.error(
-                f"PendingRollbackError during commit. "
-                f"Session: {session_id}, "
-                f"Error: {e}, "
-                f"Action: Rolling back session"
-            )
-            try:
-                await session.rollback()
-                self.logger.info(f"Rolled back session {session_id} after PendingRollbackError")
-            except Exception as rollback_error:
-                self.logger.error(
-                    f"Failed to rollback session {session_id} after PendingRollbackError. "
-                    f"Rollback error: {rollback_error}, "
-                    f"Original error: {e}"
-                )
-            return False
-            
-        except SQLAlchemyError as e:
-            self.logger.error(
-                f"SQLAlchemy error during commit. "
-                f"Session: {session_id}, "
-                f"Error type: {type(e).__name__}, "
-                f"Error: {e}, "
-                f"Action: Rolling back session"
-            )
-            try:
-                await session.rollback()
-                self.logger.info(f"Rolled back session {session_id} after SQLAlchemy error")
-            except Exception as rollback_error:
-                self.logger.error(
-                    f"Failed to rollback session {session_id} after SQLAlchemy error. "
-                    f"Rollback error: {rollback_error}, "
-                    f"Original error: {e}"
-                )
-            return False
-            
         except Exception as e:
+            return await self._handle_commit_failure(session, e)
+    
+    async def _handle_commit_failure(self, session: AsyncSession, error: Exception) -> bool:
+        """
+        Rolls back a session whose commit failed and logs the outcome.
+        
+        Messages are only built when ERROR logging is enabled, keeping the
+        formatting cost off the commit path.
+        
+        Returns:
+            bool: Always False, the commit did not happen
+        """
+        if isinstance(error, PendingRollbackError):
+            kind = "PendingRollbackError"
+        elif isinstance(error, SQLAlchemyError):
+            kind = "SQLAlchemy error"
+        else:
+            kind = "unexpected error"
+        
+        session_id = id(session)
+        log_errors = self.logger.isEnabledFor(logging.ERROR)
+        if log_errors:
             self.logger.error(
-                f"Unexpected error during commit. "
-                f"Session: {session_id}, "
-                f"Error type: {type(e).__name__}, "
-                f"Error: {e}, "
-                f"Action: Rolling back session"
+                "Commit failed with %s. Session: %s, Error type: %s, Error: %s, "
+                "Action: Rolling back session",
+                kind, session_id, type(error).__name__, error
             )
-            try:
-                await session.rollback()
-                self.logger.info(f"Rolled back session {session_id} after unexpected error")
-            except Exception as rollback_error:
+        try:
+            await session.rollback()
+            self.logger.info("Rolled back session %s after %s", session_id, kind)
+        except Exception as rollback_error:
+            if log_errors:
                 self.logger.error(
-                    f"Failed to rollback session {session_id} after unexpected error. "
-                    f"Rollback error: {rollback_error}, "
-                    f"Original error: {e}"
+                    "Failed to rollback session %s after %s. Rollback error: %s, Original error: %s",
+                    session_id, kind, rollback_error, error
                 )
-            return False
+        return False
     
     @asynccontextmanager
-    async def session_scope(self):
+    async def session_scope(self, readonly: bool = False):
         """
         Context manager for automatic session lifecycle management.
         
+        Args:
+            readonly: Use an AUTOCOMMIT session and skip the final commit
+        
         Usage:
             async with session_manager.session_scope() as session:
                 # Use session for database operations
@@ -274,9 +415,10 @@ class SessionManager:
         """
         session = None
         try:
-            session = await self.create_session()
+            session = await self.create_session(readonly)
             yield session
-            await self.safe_commit(session)
+            if not readonly:
+                await self.safe_commit(session)
             
         except Exception as e:
             self.logger.error(f"Error in session scope: {e}")
@@ -320,14 +462,12 @@ class SessionManager:
     async def _cleanup_session(self, session: AsyncSession) -> None:
         """Clean up and close a database session"""
         try:
-            session_id = id(session)
-            
             # Remove from active sessions tracking
-            self._active_sessions.discard(session_id)
+            self._active_sessions.discard(session)
             
             # Close the session
             await session.close()
-            self.logger.debug(f"Cleaned up session {session_id}")
+            self.logger.debug("Cleaned up session %s", id(session))
             
         except Exception as e:
             self.logger.warning(f"Error during session cleanup: {e}")
@@ -348,16 +488,7 @@ class SessionManager:
         
         # Connection errors are usually recoverable
         if isinstance(error, SQLAlchemyError):
-            error_str = str(error).lower()
-            recoverable_patterns = [
-                'connection',
-                'timeout',
-                'deadlock',
-                'lock',
-                'temporary',
-                'retry'
-            ]
-            return any(pattern in error_str for pattern in recoverable_patterns)
+            return RECOVERABLE_ERROR_PATTERN.search(str(error)) is not None
         
         return False
     
@@ -369,8 +500,7 @@ class SessionManager:
             dict: Session statistics
         """
         return {
-            'active_sessions': len(self._active_sessions),
-            'session_ids': list(self._active_sessions)
+            'active_sessions': len(self._active_sessions)
         }
     
     async def cleanup_all_sessions(self) -> None:
@@ -380,4 +510,9 @@ class SessionManager:
 
 
 # Global instance
-session_manager = SessionManager()
\ No newline at end of file
+session_manager = SessionManager()
+
+# Methods of the global instance bound once, for direct import by hot call sites
+execute_with_retry = session_manager.execute_with_retry
+session_scope = session_manager.session_scope
+safe_commit = session_manager.safe_commit
@@ -1,7 +1,11 @@
 import asyncio
 import logging
+import random
+import time
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List, Any
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, List, Any, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -18,6 +22,23 @@ from sqlalchemy import select
 from backend.app.models.telegram_account import TelegramAccount
 from backend.app.core.api_rate_limiter import APIRateLimiter
 
+# Seconds an is_user_authorized() result is reused before probing again
+AUTH_CACHE_TTL = 5.0
+
+# Seconds a TelegramAccount row loaded for reconnection is reused
+ACCOUNT_CACHE_TTL = 60.0
+
+# Upper bound for the exponential part of the reconnection backoff
+MAX_RECONNECT_BACKOFF_SECONDS = 120
+
+# Maximum number of accounts whose session status is tracked; the least
+# recently updated ones are forgotten first
+MAX_TRACKED_SESSIONS = 10_000
+
+# Seconds after a successful operation during which a connected session is
+# trusted without an authorization probe
+HEALTH_PROBE_SKIP_WINDOW = 30
+
 
 class SessionHealth(Enum):
     """Enumeration for session health status."""
@@ -29,7 +50,7 @@ class SessionHealth(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStatus:
     """Data class for session status information."""
     account_id: int
@@ -39,6 +60,8 @@ class SessionStatus:
     reconnect_attempts: int = 0
     last_successful_operation: Optional[datetime] = None
     rate_limit_until: Optional[datetime] = None
+    # time.monotonic() of last_check, for interval arithmetic
+    last_check_monotonic: float = 0.0
 
 
 class SessionRecoveryManager:
@@ -47,18 +70,36 @@ class SessionRecoveryManager:
     and automatic recovery with fallback account rotation.
     """
     
-    def __init__(self, rate_limiter: Optional[APIRateLimiter] = None):
+    def __init__(self, rate_limiter: Optional[APIRateLimiter] = None, auto_recover: bool = False):
+        """
+        Args:
+            rate_limiter: Rate limiter to use; a new one is created if omitted
+            auto_recover: Whether the health monitor reconnects disconnected
+                accounts by itself. Only the instance owned by telegram_manager
+                enables this, so a single loop replaces clients.
+        """
         self.logger = logging.getLogger(__name__)
         self.rate_limiter = rate_limiter or APIRateLimiter()
+        self.auto_recover = auto_recover
         
-        # Session status tracking
-        self.session_status: Dict[int, SessionStatus] = {}
+        # Session status tracking, least recently updated first
+        self.session_status: OrderedDict[int, SessionStatus] = OrderedDict()
+        # Number of tracked sessions per health, kept in step with session_status
+        self._health_counts: Counter[SessionHealth] = Counter()
+        # Healthy accounts whose operations have failed since their last check
+        self._suspect_accounts: Set[int] = set()
+        # account_id -> (probed at, authorized); the locks let concurrent callers share one probe
+        self._auth_cache: Dict[int, Tuple[float, bool]] = {}
+        self._auth_locks: Dict[int, asyncio.Lock] = {}
+        # account_id -> (loaded at, row); spares repeated reconnects a database round trip
+        self._account_cache: Dict[int, Tuple[float, TelegramAccount]] = {}
         
         # Configuration
         self.max_reconnect_attempts = 3
         self.reconnect_delay_base = 5  # seconds
         self.health_check_interval = 60  # seconds
         self.session_timeout = 300  # seconds
+        self.probe_timeout = 5.0  # seconds per connection/authorization probe
         
         # Background tasks
         self._health_monitor_task: Optional[asyncio.Task] = None
@@ -66,10 +107,13 @@ class SessionRecoveryManager:
         
         # Account rotation
         self._backup_accounts: List[int] = []
+        self._backup_account_set: Set[int] = set()  # same ids, for membership checks
         self._primary_accounts: Dict[int, int] = {}  # failed_account_id -> backup_account_id
+        self._in_use_backups: Set[int] = set()  # values of _primary_accounts
         
-        # CRITICAL FIX: Reconnection locks to prevent concurrent reconnection storms
-        self._reconnection_locks: Dict[int, asyncio.Lock] = {}
+        # In-flight reconnections; concurrent callers await the same future
+        # instead of starting a reconnection storm
+        self._inflight_reconnects: Dict[int, asyncio.Future] = {}
     
     async def ensure_session_active(self, account_id: int) -> Optional[TelegramClient]:
         """
@@ -96,9 +140,29 @@ class SessionRecoveryManager:
                 self.logger.info(f"Client {account_id} is disconnected, attempting reconnection")
                 return await self._attempt_reconnection(account_id)
             
+            status = self.session_status.get(account_id)
+            
+            # Probing inside a flood wait window only risks a longer ban
+            if status is not None and status.rate_limit_until and status.rate_limit_until > datetime.utcnow():
+                return client
+            
+            # A recent successful operation already proves the session works
+            if (
+                status is not None
+                and status.health == SessionHealth.HEALTHY
+                and status.last_successful_operation is not None
+                and account_id not in self._suspect_accounts
+                and (datetime.utcnow() - status.last_successful_operation).total_seconds() < HEALTH_PROBE_SKIP_WINDOW
+            ):
+                return client
+            
             # Check authorization status
             try:
-                if not await client.is_user_authorized():
+                authorized = await asyncio.wait_for(
+                    self._cached_is_authorized(account_id, client),
+                    timeout=self.probe_timeout
+                )
+                if not authorized:
                     self.logger.warning(f"Client {account_id} is not authorized")
                     await self._update_session_status(
                         account_id, 
@@ -106,8 +170,16 @@ class SessionRecoveryManager:
                         "Session not authorized"
                     )
                     return None
+            except asyncio.TimeoutError:
+                self.logger.warning(
+                    f"Authorization check timed out after {self.probe_timeout}s for account {account_id}, "
+                    f"attempting reconnection"
+                )
+                self._auth_cache.pop(account_id, None)
+                return await self._attempt_reconnection(account_id)
             except Exception as e:
                 self.logger.error(f"Error checking authorization for account {account_id}: {e}")
+                self._auth_cache.pop(account_id, None)
                 return await self._attempt_reconnection(account_id)
             
             # Update status as healthy
@@ -135,20 +207,13 @@ class SessionRecoveryManager:
             TelegramClient if recovery successful, None otherwise
         """
         self.logger.warning(f"Handling disconnection for account {account_id}: {error}")
+        self.mark_suspect(account_id)
+        self._auth_cache.pop(account_id, None)
         
         # Update session status
         error_msg = str(error)
         if isinstance(error, FloodWaitError):
             health = SessionHealth.RATE_LIMITED
-            # Calculate rate limit end time
-            rate_limit_until = datetime.utcnow() + timedelta(seconds=error.seconds)
-            status = self.session_status.get(account_id, SessionStatus(
-                account_id=account_id,
-                health=health,
-                last_check=datetime.utcnow()
-            ))
-            status.rate_limit_until = rate_limit_until
-            self.session_status[account_id] = status
         elif isinstance(error, AuthKeyUnregisteredError):
             health = SessionHealth.UNAUTHORIZED
         elif isinstance(error, (ConnectionError, OSError)):
@@ -160,12 +225,36 @@ class SessionRecoveryManager:
         
         # Handle rate limiting
         if isinstance(error, FloodWaitError):
+            # Record the rate limit end time
+            self.session_status[account_id].rate_limit_until = (
+                datetime.utcnow() + timedelta(seconds=error.seconds)
+            )
             self.logger.info(f"Rate limited for {error.seconds} seconds, waiting...")
             await asyncio.sleep(min(error.seconds, 300))  # Cap at 5 minutes
         
         # Attempt recovery
         return await self._attempt_reconnection(account_id)
     
+    def mark_success(self, account_id: int):
+        """
+        Records that an operation on the account just succeeded.
+        
+        For HEALTH_PROBE_SKIP_WINDOW seconds afterwards ensure_session_active
+        returns the connected client without probing its authorization.
+        """
+        status = self.session_status.get(account_id)
+        if status is not None:
+            status.last_successful_operation = datetime.utcnow()
+    
+    def mark_suspect(self, account_id: int):
+        """
+        Flags an account for an active probe on the next health sweep.
+        
+        Healthy accounts are otherwise not probed: their own operations
+        report failures, which end up here through handle_disconnection.
+        """
+        self._suspect_accounts.add(account_id)
+    
     async def rotate_to_backup_account(self, failed_account_id: int) -> Optional[TelegramClient]:
         """
         Rotates to a backup account when the primary account fails.
@@ -192,80 +281,139 @@ class SessionRecoveryManager:
                 continue  # Don't use the failed account as backup
             
             # Check if this backup is already in use
-            if backup_id in self._primary_accounts.values():
+            if backup_id in self._in_use_backups:
                 continue
             
             # Try to activate the backup account
             backup_client = await self.ensure_session_active(backup_id)
             if backup_client:
+                previous_backup = self._primary_accounts.get(failed_account_id)
+                if previous_backup is not None:
+                    self._in_use_backups.discard(previous_backup)
                 self._primary_accounts[failed_account_id] = backup_id
+                self._in_use_backups.add(backup_id)
                 self.logger.info(f"Successfully rotated to backup account {backup_id}")
                 return backup_client
         
         self.logger.error(f"No available backup accounts for failed account {failed_account_id}")
         return None
     
-    async def monitor_session_health(self) -> Dict[int, SessionStatus]:
+    async def monitor_session_health(self) -> Mapping[int, SessionStatus]:
         """
         Monitors the health of all active sessions.
         
+        Only accounts that are not known to be healthy, or were marked
+        suspect after a failed operation, are probed; healthy sessions are
+        trusted until an operation against them fails. Accounts due for a
+        check are probed concurrently, so a sweep takes about as long as the
+        slowest probe rather than the sum of all of them.
+        
         Returns:
-            Dictionary of account_id -> SessionStatus
+            Read-only live view of account_id -> SessionStatus
         """
         from backend.app.services.telegram_service import telegram_manager
         
+        now = time.monotonic()
         current_time = datetime.utcnow()
         
+        checks = []
         for account_id, client in telegram_manager.clients.items():
-            try:
+            status = self.session_status.get(account_id)
+            # Skip accounts inside their flood wait window
+            if status is not None and status.rate_limit_until and status.rate_limit_until > current_time:
+                continue
+            if status is not None and account_id not in self._suspect_accounts:
+                # Skip healthy sessions nothing has gone wrong with
+                if status.health == SessionHealth.HEALTHY:
+                    continue
                 # Skip if recently checked
-                if account_id in self.session_status:
-                    last_check = self.session_status[account_id].last_check
-                    if (current_time - last_check).seconds < self.health_check_interval:
-                        continue
-                
-                # Perform health check
-                if not client.is_connected():
-                    await self._update_session_status(
-                        account_id, 
-                        SessionHealth.DISCONNECTED,
-                        "Client not connected"
-                    )
+                if now - status.last_check_monotonic < self.health_check_interval:
                     continue
-                
-                # Check authorization with timeout
-                try:
-                    authorized = await asyncio.wait_for(
-                        client.is_user_authorized(),
-                        timeout=10.0
-                    )
-                    if not authorized:
-                        await self._update_session_status(
-                            account_id, 
-                            SessionHealth.UNAUTHORIZED,
-                            "Session not authorized"
-                        )
-                        continue
-                except asyncio.TimeoutError:
+            checks.append(self._check_session_health(account_id, client))
+        
+        self._forget_departed_accounts(telegram_manager.clients)
+        
+        if checks:
+            await asyncio.gather(*checks, return_exceptions=True)
+        
+        return MappingProxyType(self.session_status)
+    
+    def _forget_departed_accounts(self, clients: Dict[int, TelegramClient]):
+        """Drops per-account probe locks and cached results for accounts without a client."""
+        for account_id in [aid for aid in self._auth_locks if aid not in clients]:
+            if not self._auth_locks[account_id].locked():
+                del self._auth_locks[account_id]
+        for account_id in [aid for aid in self._auth_cache if aid not in clients]:
+            del self._auth_cache[account_id]
+    
+    async def _check_session_health(self, account_id: int, client: TelegramClient):
+        """Probes a single session and records its health."""
+        try:
+            # Perform health check
+            if not client.is_connected():
+                await self._update_session_status(
+                    account_id, 
+                    SessionHealth.DISCONNECTED,
+                    "Client not connected"
+                )
+                return
+            
+            # Check authorization with timeout
+            try:
+                authorized = await asyncio.wait_for(
+                    self._cached_is_authorized(account_id, client),
+                    timeout=10.0
+                )
+                if not authorized:
                     await self._update_session_status(
                         account_id, 
-                        SessionHealth.ERROR,
-                        "Health check timeout"
+                        SessionHealth.UNAUTHORIZED,
+                        "Session not authorized"
                     )
-                    continue
-                
-                # Session is healthy
-                await self._update_session_status(account_id, SessionHealth.HEALTHY)
-                
-            except Exception as e:
-                self.logger.error(f"Error checking health for account {account_id}: {e}")
+                    return
+            except asyncio.TimeoutError:
                 await self._update_session_status(
                     account_id, 
                     SessionHealth.ERROR,
-                    str(e)
+                    "Health check timeout"
                 )
+                return
+            
+            # Session is healthy
+            await self._update_session_status(account_id, SessionHealth.HEALTHY)
+            
+        except Exception as e:
+            self.logger.error(f"Error checking health for account {account_id}: {e}")
+            await self._update_session_status(
+                account_id, 
+                SessionHealth.ERROR,
+                str(e)
+            )
+    
+    async def _cached_is_authorized(self, account_id: int, client: TelegramClient) -> bool:
+        """
+        Returns client.is_user_authorized(), reusing results for AUTH_CACHE_TTL seconds.
         
-        return self.session_status.copy()
+        Concurrent callers for the same account wait for a single probe.
+        """
+        cached = self._auth_cache.get(account_id)
+        if cached is not None and time.monotonic() - cached[0] < AUTH_CACHE_TTL:
+            return cached[1]
+        
+        # No await between the lookup and the insert, so no second lock can be created
+        lock = self._auth_locks.get(account_id)
+        if lock is None:
+            lock = self._auth_locks[account_id] = asyncio.Lock()
+        
+        async with lock:
+            # Another caller may have probed while we waited for the lock
+            cached = self._auth_cache.get(account_id)
+            if cached is not None and time.monotonic() - cached[0] < AUTH_CACHE_TTL:
+                return cached[1]
+            
+            authorized = await client.is_user_authorized()
+            self._auth_cache[account_id] = (time.monotonic(), authorized)
+            return authorized
     
     async def start_health_monitoring(self):
         """Starts the background health monitoring task."""
@@ -289,30 +437,27 @@ class SessionRecoveryManager:
     
     async def add_backup_account(self, account_id: int):
         """Adds an account to the backup accounts list."""
-        if account_id not in self._backup_accounts:
+        if account_id not in self._backup_account_set:
             self._backup_accounts.append(account_id)
+            self._backup_account_set.add(account_id)
+            self._account_cache.pop(account_id, None)
             self.logger.info(f"Added backup account {account_id}")
     
     async def remove_backup_account(self, account_id: int):
         """Removes an account from the backup accounts list."""
-        if account_id in self._backup_accounts:
+        if account_id in self._backup_account_set:
             self._backup_accounts.remove(account_id)
+            self._backup_account_set.discard(account_id)
+            self._account_cache.pop(account_id, None)
             self.logger.info(f"Removed backup account {account_id}")
     
     async def get_session_statistics(self) -> Dict[str, Any]:
         """Returns statistics about session health and recovery."""
-        total_sessions = len(self.session_status)
-        healthy_sessions = sum(1 for s in self.session_status.values() if s.health == SessionHealth.HEALTHY)
-        
-        health_counts = {}
-        for health in SessionHealth:
-            health_counts[health.value] = sum(
-                1 for s in self.session_status.values() if s.health == health
-            )
+        health_counts = {health.value: self._health_counts[health] for health in SessionHealth}
         
         return {
-            "total_sessions": total_sessions,
-            "healthy_sessions": healthy_sessions,
+            "total_sessions": len(self.session_status),
+            "healthy_sessions": self._health_counts[SessionHealth.HEALTHY],
             "health_distribution": health_counts,
             "backup_accounts": len(self._backup_accounts),
             "active_rotations": len(self._primary_accounts),
@@ -322,7 +467,9 @@ class SessionRecoveryManager:
     async def _attempt_reconnection(self, account_id: int) -> Optional[TelegramClient]:
         """
         Attempts to reconnect a session with exponential backoff.
-        Uses a lock to prevent concurrent reconnection attempts for the same account.
+        Concurrent calls for the same account share a single reconnection and
+        all receive its result; the backoff delay is slept once inside it
+        rather than by each caller in turn.
         
         Args:
             account_id: The account ID to reconnect
@@ -330,87 +477,189 @@ class SessionRecoveryManager:
         Returns:
             TelegramClient if successful, None otherwise
         """
-        # CRITICAL FIX: Use lock to prevent reconnection storm
-        if account_id not in self._reconnection_locks:
-            self._reconnection_locks[account_id] = asyncio.Lock()
-        
-        # Try to acquire lock - if already locked, another reconnection is in progress
-        if self._reconnection_locks[account_id].locked():
-            self.logger.info(f"Reconnection already in progress for account {account_id}, skipping")
-            # Wait for the ongoing reconnection to complete
-            async with self._reconnection_locks[account_id]:
-                pass
-            # Check if reconnection was successful
-            from backend.app.services.telegram_service import telegram_manager
-            client = telegram_manager.clients.get(account_id)
-            if client and client.is_connected():
-                return client
+        inflight = self._inflight_reconnects.get(account_id)
+        if inflight is not None:
+            self.logger.info(f"Reconnection already in progress for account {account_id}, waiting for it")
+            # Shielded so a cancelled waiter does not cancel the shared result
+            return await asyncio.shield(inflight)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight_reconnects[account_id] = future
+        client = None
+        try:
+            client = await self._reconnect(account_id)
+            return client
+        finally:
+            del self._inflight_reconnects[account_id]
+            future.set_result(client)
+    
+    async def _reconnect(self, account_id: int) -> Optional[TelegramClient]:
+        """Performs one reconnection attempt; only called through _attempt_reconnection."""
+        from backend.app.services.telegram_service import telegram_manager
+        
+        status = self.session_status.get(account_id, SessionStatus(
+            account_id=account_id,
+            health=SessionHealth.UNKNOWN,
+            last_check=datetime.utcnow()
+        ))
+        
+        if status.reconnect_attempts >= self.max_reconnect_attempts:
+            self.logger.error(f"Max reconnection attempts reached for account {account_id}")
             return None
         
-        async with self._reconnection_locks[account_id]:
-            from backend.app.services.telegram_service import telegram_manager
-            from backend.app.db.database import async_session_maker
-            
-            status = self.session_status.get(account_id, SessionStatus(
-                account_id=account_id,
-                health=SessionHealth.UNKNOWN,
-                last_check=datetime.utcnow()
-            ))
+        client = None
+        try:
+            # Calculate delay with capped exponential backoff, plus up to one base
+            # delay of jitter so accounts that dropped together do not retry in lockstep
+            delay = min(
+                self.reconnect_delay_base * (2 ** status.reconnect_attempts),
+                MAX_RECONNECT_BACKOFF_SECONDS
+            ) + random.uniform(0, self.reconnect_delay_base)
+            self.logger.info(f"Attempting reconnection for account {account_id} (attempt {status.reconnect_attempts + 1}) after {delay:.1f}s delay")
             
-            if status.reconnect_attempts >= self.max_reconnect_attempts:
-                self.logger.error(f"Max reconnection attempts reached for account {account_id}")
+            # The account lookup runs during the backoff wait instead of after it
+            account, _ = await asyncio.gather(
+                self._fetch_account(account_id),
+                asyncio.sleep(delay)
+            )
+            if not account:
+                self.logger.error(f"Account {account_id} not found in database")
                 return None
             
+            # Create new client; it is disconnected again on any failure below
+            client = await telegram_manager.create_client(account)
+            await client.connect()
+            
+            # Check authorization; a timeout counts as a failed attempt
             try:
-                # Calculate delay with exponential backoff
-                delay = self.reconnect_delay_base * (2 ** status.reconnect_attempts)
-                self.logger.info(f"Attempting reconnection for account {account_id} (attempt {status.reconnect_attempts + 1}) after {delay}s delay")
-                
-                await asyncio.sleep(delay)
-                
-                # Get account from database
-                async with async_session_maker() as db:
-                    result = await db.execute(select(TelegramAccount).where(TelegramAccount.id == account_id))
-                    account = result.scalar_one_or_none()
-                    
-                    if not account:
-                        self.logger.error(f"Account {account_id} not found in database")
-                        return None
-                    
-                    # Create new client
-                    client = await telegram_manager.create_client(account)
-                    await client.connect()
-                    
-                    # Check authorization
-                    if not await client.is_user_authorized():
-                        self.logger.warning(f"Account {account_id} not authorized after reconnection")
-                        await self._update_session_status(
-                            account_id, 
-                            SessionHealth.UNAUTHORIZED,
-                            "Not authorized after reconnection"
-                        )
-                        return None
-                    
-                    # Update client in manager
-                    telegram_manager.clients[account_id] = client
-                    
-                    # Reset reconnection attempts and update status
-                    status.reconnect_attempts = 0
-                    status.last_successful_operation = datetime.utcnow()
-                    await self._update_session_status(account_id, SessionHealth.HEALTHY)
-                    
-                    self.logger.info(f"Successfully reconnected account {account_id}")
-                    return client
-                    
-            except Exception as e:
-                status.reconnect_attempts += 1
-                self.logger.error(f"Reconnection attempt {status.reconnect_attempts} failed for account {account_id}: {e}")
+                authorized = await asyncio.wait_for(
+                    client.is_user_authorized(),
+                    timeout=self.probe_timeout
+                )
+            except asyncio.TimeoutError:
+                self.logger.warning(
+                    f"Authorization check timed out after {self.probe_timeout}s "
+                    f"for reconnected account {account_id}"
+                )
+                raise
+            if not authorized:
+                self.logger.warning(f"Account {account_id} not authorized after reconnection")
+                # Credentials were likely changed; reload them next time
+                self._account_cache.pop(account_id, None)
                 await self._update_session_status(
                     account_id, 
-                    SessionHealth.ERROR,
-                    f"Reconnection failed: {str(e)}"
+                    SessionHealth.UNAUTHORIZED,
+                    "Not authorized after reconnection"
                 )
+                await self._disconnect_quietly(account_id, client)
                 return None
+            
+            # Replace the client in the manager, closing the old connection on the same auth key
+            previous = telegram_manager.clients.get(account_id)
+            telegram_manager.clients[account_id] = client
+            if previous is not None and previous is not client:
+                await self._disconnect_quietly(account_id, previous)
+            self._auth_cache[account_id] = (time.monotonic(), True)
+            
+            # Reset reconnection attempts and update status
+            status.reconnect_attempts = 0
+            status.last_successful_operation = datetime.utcnow()
+            await self._update_session_status(account_id, SessionHealth.HEALTHY)
+            
+            self.logger.info(f"Successfully reconnected account {account_id}")
+            return client
+            
+        except Exception as e:
+            if client is not None:
+                await self._disconnect_quietly(account_id, client)
+            status.reconnect_attempts += 1
+            self.logger.error(f"Reconnection attempt {status.reconnect_attempts} failed for account {account_id}: {e}")
+            await self._update_session_status(
+                account_id, 
+                SessionHealth.ERROR,
+                f"Reconnection failed: {str(e)}"
+            )
+            return None
+    
+    async def _disconnect_quietly(self, account_id: int, client: TelegramClient):
+        """Disconnects a client that is being dropped, logging rather than raising on failure."""
+        try:
+            await client.disconnect()
+        except Exception as e:
+            self.logger.warning(f"Error disconnecting client for account {account_id}: {e}")
+    
+    async def recover_all_disconnected(self) -> Dict[int, Optional[TelegramClient]]:
+        """
+        Reconnects every tracked account that is disconnected and still has
+        reconnection attempts left. Accounts in error are left alone, as their
+        client may still be connected.
+        
+        Returns:
+            Dictionary of account_id -> reconnected client (None on failure)
+        """
+        account_ids = [
+            account_id for account_id, status in self.session_status.items()
+            if status.health == SessionHealth.DISCONNECTED
+            and status.reconnect_attempts < self.max_reconnect_attempts
+        ]
+        if not account_ids:
+            return {}
+        
+        self.logger.info(f"Recovering {len(account_ids)} disconnected sessions")
+        return await self._bulk_reconnect(account_ids)
+    
+    async def _bulk_reconnect(self, account_ids: List[int]) -> Dict[int, Optional[TelegramClient]]:
+        """
+        Reconnects several accounts concurrently.
+        
+        The account rows are loaded with a single query up front, so the
+        individual reconnections find them in the account cache.
+        """
+        from backend.app.db.database import async_session_maker
+        
+        now = time.monotonic()
+        missing = [
+            account_id for account_id in account_ids
+            if account_id not in self._account_cache
+            or now - self._account_cache[account_id][0] >= ACCOUNT_CACHE_TTL
+        ]
+        if missing:
+            async with async_session_maker() as db:
+                result = await db.execute(select(TelegramAccount).where(TelegramAccount.id.in_(missing)))
+                for account in result.scalars():
+                    self._account_cache[account.id] = (now, account)
+        
+        results = await asyncio.gather(
+            *[self._attempt_reconnection(account_id) for account_id in account_ids],
+            return_exceptions=True
+        )
+        return {
+            account_id: None if isinstance(result, BaseException) else result
+            for account_id, result in zip(account_ids, results)
+        }
+    
+    async def _fetch_account(self, account_id: int) -> Optional[TelegramAccount]:
+        """
+        Loads the account row used to rebuild a client, cached for ACCOUNT_CACHE_TTL seconds.
+        
+        The database session is closed before returning, so no pooled
+        connection is held across the Telegram round trips that follow.
+        """
+        cached = self._account_cache.get(account_id)
+        if cached is not None and time.monotonic() - cached[0] < ACCOUNT_CACHE_TTL:
+            return cached[1]
+        
+        from backend.app.db.database import async_session_maker
+        
+        async with async_session_maker() as db:
+            result = await db.execute(select(TelegramAccount).where(TelegramAccount.id == account_id))
+            account = result.scalar_one_or_none()
+        
+        if account is not None:
+            self._account_cache[account_id] = (time.monotonic(), account)
+        else:
+            self._account_cache.pop(account_id, None)
+        return account
     
     async def _update_session_status(
         self, 
@@ -420,11 +669,18 @@ class SessionRecoveryManager:
     ):
         """Updates the session status for an account."""
         current_time = datetime.utcnow()
+        current_monotonic = time.monotonic()
+        if health == SessionHealth.HEALTHY:
+            self._suspect_accounts.discard(account_id)
         
         if account_id in self.session_status:
             status = self.session_status[account_id]
+            self.session_status.move_to_end(account_id)
+            self._health_counts[status.health] -= 1
+            self._health_counts[health] += 1
             status.health = health
             status.last_check = current_time
+            status.last_check_monotonic = current_monotonic
             status.error_message = error_message
             if health == SessionHealth.HEALTHY:
                 status.last_successful_operation = current_time
@@ -434,15 +690,31 @@ class SessionRecoveryManager:
                 health=health,
                 last_check=current_time,
                 error_message=error_message,
-                last_successful_operation=current_time if health == SessionHealth.HEALTHY else None
+                last_successful_operation=current_time if health == SessionHealth.HEALTHY else None,
+                last_check_monotonic=current_monotonic
             )
             self.session_status[account_id] = status
+            self._health_counts[health] += 1
+            while len(self.session_status) > MAX_TRACKED_SESSIONS:
+                self._forget_account(*self.session_status.popitem(last=False))
+    
+    def _forget_account(self, account_id: int, status: SessionStatus):
+        """Drops the per-account state kept alongside an evicted session status."""
+        self._health_counts[status.health] -= 1
+        self._suspect_accounts.discard(account_id)
+        self._auth_cache.pop(account_id, None)
+        self._account_cache.pop(account_id, None)
+        lock = self._auth_locks.get(account_id)
+        if lock is not None and not lock.locked():
+            del self._auth_locks[account_id]
     
     async def _health_monitor_loop(self):
         """Background loop for monitoring session health."""
         while self._is_monitoring:
             try:
                 await self.monitor_session_health()
+                if self.auto_recover:
+                    await self.recover_all_disconnected()
                 await asyncio.sleep(self.health_check_interval)
             except asyncio.CancelledError:
                 break
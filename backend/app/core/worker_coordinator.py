@@ -1,15 +1,28 @@
 import asyncio
+import bisect
+import heapq
+import itertools
 import logging
 import time
+from collections import Counter, deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable, Set, Tuple
+from typing import Deque, Dict, List, Mapping, Optional, Any, Callable, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
-import statistics
+from types import MappingProxyType
 import uuid
 
 from backend.app.core.queue_types import WorkerInfo, WorkerStatus, TaskItem
 
+# Number of most recent task durations averaged into a worker's average_task_time
+TASK_TIME_WINDOW = 50
+
+# Stale entries tolerated in the load score heap, per scored worker, before it is rebuilt
+LOAD_HEAP_SLACK = 4
+
+# Completion reports applied per pass of the completion drain loop before yielding
+COMPLETION_BATCH_SIZE = 256
+
 
 class LoadBalancingStrategy(Enum):
     """Enumeration for load balancing strategies."""
@@ -38,6 +51,7 @@ class WorkerMetrics:
     cpu_usage: float = 0.0
     memory_usage: float = 0.0
     last_health_check: Optional[datetime] = None
+    last_health_check_ts: float = 0.0  # time.monotonic() of last_health_check
     health_status: HealthCheckStatus = HealthCheckStatus.UNKNOWN
     consecutive_failures: int = 0
     total_uptime: timedelta = field(default_factory=lambda: timedelta())
@@ -48,7 +62,7 @@ class LoadBalancingResult:
     """Data class for load balancing results."""
     selected_worker_id: str
     reason: str
-    load_scores: Dict[str, float]
+    load_scores: Mapping[str, float]  # read-only live view; copy it to keep a snapshot
     strategy_used: LoadBalancingStrategy
 
 
@@ -75,55 +89,148 @@ class WorkerCoordinator:
         
         # Worker tracking
         self._worker_metrics: Dict[str, WorkerMetrics] = {}
+        self._metrics_view: Mapping[str, WorkerMetrics] = MappingProxyType(self._worker_metrics)
         self._worker_assignments: Dict[str, str] = {}  # task_id -> worker_id
-        self._worker_queues: Dict[str, List[str]] = {}  # worker_id -> task_ids
+        # worker_id -> task_ids; dicts used as ordered sets for O(1) removal
+        self._worker_queues: Dict[str, Dict[str, None]] = {}
+        # worker_id -> queue size, updated alongside _worker_queues
+        self._load_distribution: Dict[str, int] = {}
+        self._load_distribution_view: Mapping[str, int] = MappingProxyType(self._load_distribution)
+        # Worker ids by current health status, kept in step with WorkerMetrics.health_status
+        self._workers_by_health: Dict[HealthCheckStatus, Set[str]] = {
+            status: set() for status in HealthCheckStatus
+        }
         
         # Load balancing
         self._round_robin_index = 0
         self._load_scores: Dict[str, float] = {}
+        self._load_scores_view: Mapping[str, float] = MappingProxyType(self._load_scores)
+        # Min-heap of (score, epoch, worker_id); an entry is current only while its
+        # epoch matches _load_epoch[worker_id], older ones are skipped lazily.
+        # Epochs come from one counter so they are never reused, even by a
+        # worker that is retired and registered again.
+        self._load_heap: List[Tuple[float, int, str]] = []
+        self._load_epoch: Dict[str, int] = {}
+        self._epoch_counter = itertools.count(1)
+        self._worker_statuses: Dict[str, Optional[WorkerStatus]] = {}  # last seen per worker
+        self._status_counts: Counter = Counter()  # workers per last seen status
+        # Min-heap of (average_task_time, worker_id); an entry is current only while it
+        # matches the worker's metrics, older ones are skipped lazily
+        self._speed_heap: List[Tuple[float, str]] = []
         
         # Health monitoring
         self._health_monitor_task: Optional[asyncio.Task] = None
         self._is_monitoring = False
+        # Min-heap of (next check ts, registration, worker_id); entries from an
+        # earlier registration of the worker are skipped
+        self._health_deadlines: List[Tuple[float, int, str]] = []
+        self._registrations: Dict[str, int] = {}
+        self._registration_counter = itertools.count(1)
         
         # Performance tracking
-        self._performance_history: Dict[str, List[Tuple[datetime, float]]] = {}
-        self._task_completion_times: Dict[str, List[float]] = {}
-        
-        # Coordination callbacks
-        self._worker_failure_callbacks: List[Callable] = []
-        self._load_rebalance_callbacks: List[Callable] = []
+        self._performance_history: Dict[str, Deque[Tuple[float, float]]] = {}  # (monotonic ts, time)
+        self._task_completion_times: Dict[str, Deque[float]] = {}
+        self._task_time_sums: Dict[str, float] = {}  # running sum of each window
+        
+        # Completion reports queued by report_task_completion_nowait as
+        # (task_id, worker_id, success, processing_time, monotonic ts)
+        self._completion_inbox: Deque[Tuple[str, str, bool, float, float]] = deque()
+        self._completion_event = asyncio.Event()
+        self._completion_task: Optional[asyncio.Task] = None
+        
+        # Coordination callbacks as (callback, is coroutine function), checked once at registration
+        self._worker_failure_callbacks: List[Tuple[Callable, bool]] = []
+        self._load_rebalance_callbacks: List[Tuple[Callable, bool]] = []
     
     async def start_coordination(self, workers: Dict[str, WorkerInfo]):
         """Starts worker coordination and monitoring."""
         self.logger.info("Starting worker coordination")
         
+        # Drop state left over from workers that are no longer part of the pool
+        for worker_id in [wid for wid in self._worker_metrics if wid not in workers]:
+            self.retire_worker(worker_id)
+        
         # Initialize metrics for all workers
         for worker_id, worker_info in workers.items():
-            if worker_id not in self._worker_metrics:
-                self._worker_metrics[worker_id] = WorkerMetrics(
-                    worker_id=worker_id,
-                    last_health_check=datetime.utcnow()
-                )
-            self._worker_queues[worker_id] = []
+            self._register_worker(worker_id)
+            self.update_worker_status(worker_id, worker_info.status)
         
         # Start health monitoring
         self._is_monitoring = True
         self._health_monitor_task = asyncio.create_task(self._health_monitor_loop())
+        self._completion_task = asyncio.create_task(self._completion_drain_loop())
         
         self.logger.info(f"Worker coordination started for {len(workers)} workers")
     
+    def _register_worker(self, worker_id: str):
+        """Creates metrics for a new worker and resets its queue."""
+        if worker_id not in self._worker_metrics:
+            metrics = self._worker_metrics[worker_id] = WorkerMetrics(
+                worker_id=worker_id,
+                last_health_check=datetime.utcnow(),
+                last_health_check_ts=time.monotonic()
+            )
+            self._workers_by_health[metrics.health_status].add(worker_id)
+            registration = self._registrations[worker_id] = next(self._registration_counter)
+            heapq.heappush(self._health_deadlines, (metrics.last_health_check_ts, registration, worker_id))
+        self._worker_queues[worker_id] = {}
+        self._load_distribution[worker_id] = 0
+    
+    def retire_worker(self, worker_id: str):
+        """
+        Forgets a worker that has left the pool.
+        
+        Tasks still queued on the worker are handed to healthy workers, then
+        every piece of per-worker state is dropped. Heap entries for the worker
+        are left behind and skipped lazily, as for any superseded entry.
+        """
+        metrics = self._worker_metrics.get(worker_id)
+        if metrics is None:
+            return
+        
+        queued_tasks = list(self._worker_queues.get(worker_id, ()))
+        self._redistribute_tasks(worker_id)
+        for task_id in queued_tasks:
+            if self._worker_assignments.get(task_id) == worker_id:
+                del self._worker_assignments[task_id]  # nowhere to move it
+        
+        del self._worker_metrics[worker_id]
+        self._workers_by_health[metrics.health_status].discard(worker_id)
+        self._worker_queues.pop(worker_id, None)
+        self._load_distribution.pop(worker_id, None)
+        self._load_scores.pop(worker_id, None)
+        self._load_epoch.pop(worker_id, None)
+        self._registrations.pop(worker_id, None)
+        if worker_id in self._worker_statuses:
+            self._status_counts[self._worker_statuses.pop(worker_id)] -= 1
+        self._performance_history.pop(worker_id, None)
+        self._task_completion_times.pop(worker_id, None)
+        self._task_time_sums.pop(worker_id, None)
+        
+        self.logger.info(f"Retired worker {worker_id}")
+    
+    def _set_health_status(self, worker_id: str, metrics: WorkerMetrics, health_status: HealthCheckStatus):
+        """Changes a worker's health status, keeping the per-status sets in step."""
+        if metrics.health_status != health_status:
+            self._workers_by_health[metrics.health_status].discard(worker_id)
+            self._workers_by_health[health_status].add(worker_id)
+            metrics.health_status = health_status
+    
     async def stop_coordination(self):
         """Stops worker coordination and monitoring."""
         self.logger.info("Stopping worker coordination")
         
         self._is_monitoring = False
-        if self._health_monitor_task:
-            self._health_monitor_task.cancel()
-            try:
-                await self._health_monitor_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._health_monitor_task, self._completion_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        
+        # Apply reports that were still queued
+        await self._drain_completions()
         
         self.logger.info("Worker coordination stopped")
     
@@ -148,23 +255,25 @@ class WorkerCoordinator:
             raise ValueError("No available workers for task assignment")
         
         # Update load scores
-        await self._update_load_scores(available_workers, worker_info)
+        self._update_load_scores(available_workers, worker_info)
         
         # Select worker based on strategy
         if self.load_balancing_strategy == LoadBalancingStrategy.ROUND_ROBIN:
-            result = await self._round_robin_assignment(available_workers)
+            result = self._round_robin_assignment(available_workers)
         elif self.load_balancing_strategy == LoadBalancingStrategy.LEAST_LOADED:
-            result = await self._least_loaded_assignment(available_workers)
+            result = self._least_loaded_assignment(available_workers)
         elif self.load_balancing_strategy == LoadBalancingStrategy.FASTEST_WORKER:
-            result = await self._fastest_worker_assignment(available_workers)
+            result = self._fastest_worker_assignment(available_workers)
         elif self.load_balancing_strategy == LoadBalancingStrategy.PRIORITY_BASED:
-            result = await self._priority_based_assignment(task_item, available_workers)
+            result = self._priority_based_assignment(task_item, available_workers)
         else:
-            result = await self._least_loaded_assignment(available_workers)
+            result = self._least_loaded_assignment(available_workers)
         
         # Record assignment
         self._worker_assignments[task_item.task_id] = result.selected_worker_id
-        self._worker_queues[result.selected_worker_id].append(task_item.task_id)
+        self._worker_queues[result.selected_worker_id][task_item.task_id] = None
+        self._load_distribution[result.selected_worker_id] += 1
+        self._refresh_load_score(result.selected_worker_id)
         
         self.logger.debug(
             f"Assigned task {task_item.task_id} to worker {result.selected_worker_id} "
@@ -189,21 +298,91 @@ class WorkerCoordinator:
             success: Whether the task was successful
             processing_time: Time taken to process the task
         """
+        if self._record_completion(task_id, worker_id, success, processing_time, time.monotonic()):
+            await self._handle_unhealthy_worker(worker_id)
+    
+    def report_task_completion_nowait(
+        self,
+        task_id: str,
+        worker_id: str,
+        success: bool,
+        processing_time: float
+    ):
+        """
+        Queues a task completion report without waiting for it to be applied.
+        
+        Reports are applied in batches by the completion drain loop started
+        with start_coordination; any still queued are applied on stop.
+        """
+        self._completion_inbox.append((task_id, worker_id, success, processing_time, time.monotonic()))
+        self._completion_event.set()
+    
+    async def _completion_drain_loop(self):
+        """Background loop applying queued completion reports."""
+        while self._is_monitoring:
+            try:
+                await self._completion_event.wait()
+                self._completion_event.clear()
+                await self._drain_completions()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error in completion drain loop: {e}")
+    
+    async def _drain_completions(self):
+        """Applies queued completion reports, COMPLETION_BATCH_SIZE at a time."""
+        inbox = self._completion_inbox
+        while inbox:
+            unhealthy_workers: Dict[str, None] = {}
+            for _ in range(min(len(inbox), COMPLETION_BATCH_SIZE)):
+                task_id, worker_id, success, processing_time, current_time = inbox.popleft()
+                if self._record_completion(task_id, worker_id, success, processing_time, current_time):
+                    unhealthy_workers[worker_id] = None
+            
+            for worker_id in unhealthy_workers:
+                await self._handle_unhealthy_worker(worker_id)
+            
+            # Let other tasks run between batches
+            await asyncio.sleep(0)
+    
+    def _record_completion(
+        self,
+        task_id: str,
+        worker_id: str,
+        success: bool,
+        processing_time: float,
+        current_time: float
+    ) -> bool:
+        """
+        Applies a task completion to the worker's metrics and queue.
+        
+        Returns:
+            True if the worker has just been marked unhealthy and needs handling
+        """
+        became_unhealthy = False
+        
         # Update worker metrics
         if worker_id in self._worker_metrics:
             metrics = self._worker_metrics[worker_id]
             
-            # Update task completion times
-            if worker_id not in self._task_completion_times:
-                self._task_completion_times[worker_id] = []
-            self._task_completion_times[worker_id].append(processing_time)
-            
-            # Keep only recent completion times (last 50)
-            if len(self._task_completion_times[worker_id]) > 50:
-                self._task_completion_times[worker_id] = self._task_completion_times[worker_id][-50:]
+            # Update task completion times, keeping only the most recent ones
+            completion_times = self._task_completion_times.get(worker_id)
+            if completion_times is None:
+                completion_times = self._task_completion_times[worker_id] = deque(maxlen=TASK_TIME_WINDOW)
+                self._task_time_sums[worker_id] = 0.0
+            time_sum = self._task_time_sums[worker_id]
+            if len(completion_times) == TASK_TIME_WINDOW:
+                time_sum -= completion_times[0]  # about to drop out of the window
+            completion_times.append(processing_time)
+            time_sum += processing_time
+            self._task_time_sums[worker_id] = time_sum
             
             # Update average task time
-            metrics.average_task_time = statistics.mean(self._task_completion_times[worker_id])
+            average_task_time = time_sum / len(completion_times)
+            if average_task_time != metrics.average_task_time:
+                metrics.average_task_time = average_task_time
+                if average_task_time > 0:
+                    self._push_task_time(worker_id, average_task_time)
             
             # Update success/error rates
             if success:
@@ -212,44 +391,45 @@ class WorkerCoordinator:
                 metrics.consecutive_failures += 1
             
             # Calculate tasks per minute
-            current_time = datetime.utcnow()
-            if worker_id not in self._performance_history:
-                self._performance_history[worker_id] = []
+            history = self._performance_history.get(worker_id)
+            if history is None:
+                history = self._performance_history[worker_id] = deque()
             
-            self._performance_history[worker_id].append((current_time, processing_time))
+            history.append((current_time, processing_time))
             
-            # Keep only last hour of performance data
-            cutoff_time = current_time - timedelta(hours=1)
-            self._performance_history[worker_id] = [
-                (timestamp, time_taken) for timestamp, time_taken in self._performance_history[worker_id]
-                if timestamp > cutoff_time
-            ]
+            # Keep only last hour of performance data; entries are in time order
+            cutoff_time = current_time - 3600.0
+            while history[0][0] <= cutoff_time:
+                history.popleft()
             
             # Calculate tasks per minute
-            if len(self._performance_history[worker_id]) > 1:
-                time_span = (
-                    self._performance_history[worker_id][-1][0] - 
-                    self._performance_history[worker_id][0][0]
-                ).total_seconds() / 60  # Convert to minutes
+            if len(history) > 1:
+                time_span = (history[-1][0] - history[0][0]) / 60  # Convert to minutes
                 
                 if time_span > 0:
-                    metrics.tasks_per_minute = len(self._performance_history[worker_id]) / time_span
+                    metrics.tasks_per_minute = len(history) / time_span
             
             # Update health status based on consecutive failures
             if metrics.consecutive_failures >= self.max_consecutive_failures:
-                metrics.health_status = HealthCheckStatus.UNHEALTHY
-                await self._handle_unhealthy_worker(worker_id)
+                self._set_health_status(worker_id, metrics, HealthCheckStatus.UNHEALTHY)
+                became_unhealthy = True
             elif metrics.consecutive_failures > 0:
-                metrics.health_status = HealthCheckStatus.DEGRADED
+                self._set_health_status(worker_id, metrics, HealthCheckStatus.DEGRADED)
             else:
-                metrics.health_status = HealthCheckStatus.HEALTHY
+                self._set_health_status(worker_id, metrics, HealthCheckStatus.HEALTHY)
         
         # Clean up assignment tracking
         if task_id in self._worker_assignments:
             del self._worker_assignments[task_id]
         
         if worker_id in self._worker_queues and task_id in self._worker_queues[worker_id]:
-            self._worker_queues[worker_id].remove(task_id)
+            del self._worker_queues[worker_id][task_id]
+            self._load_distribution[worker_id] -= 1
+        
+        if worker_id in self._load_scores:
+            self._refresh_load_score(worker_id)
+        
+        return became_unhealthy
     
     async def get_worker_recommendations(
         self,
@@ -272,30 +452,26 @@ class WorkerCoordinator:
             "optimization_suggestions": []
         }
         
-        # Analyze worker performance
-        healthy_workers = 0
-        degraded_workers = 0
-        unhealthy_workers = 0
-        
-        avg_task_times = []
+        # Analyze worker performance in a single pass
+        health_counts = {status: len(workers) for status, workers in self._workers_by_health.items()}
+        task_time_sum = 0.0
+        task_time_count = 0
         tasks_per_minute_total = 0
         
-        for worker_id, metrics in self._worker_metrics.items():
-            if metrics.health_status == HealthCheckStatus.HEALTHY:
-                healthy_workers += 1
-            elif metrics.health_status == HealthCheckStatus.DEGRADED:
-                degraded_workers += 1
-            elif metrics.health_status == HealthCheckStatus.UNHEALTHY:
-                unhealthy_workers += 1
-            
+        for metrics in self._worker_metrics.values():
             if metrics.average_task_time > 0:
-                avg_task_times.append(metrics.average_task_time)
+                task_time_sum += metrics.average_task_time
+                task_time_count += 1
             
             tasks_per_minute_total += metrics.tasks_per_minute
         
+        unhealthy_workers = health_counts[HealthCheckStatus.UNHEALTHY]
+        degraded_workers = health_counts[HealthCheckStatus.DEGRADED]
+        
         # Scaling recommendations
         total_workers = len(worker_info)
-        utilization_rate = (total_workers - len([w for w in worker_info.values() if w.status == WorkerStatus.IDLE])) / total_workers
+        idle_workers = self._status_counts[WorkerStatus.IDLE]
+        utilization_rate = (total_workers - idle_workers) / total_workers
         
         if utilization_rate > 0.8:
             recommendations["scaling_recommendation"] = "scale_up"
@@ -317,7 +493,7 @@ class WorkerCoordinator:
                 f"{degraded_workers} workers showing degraded performance"
             )
         
-        if avg_task_times and statistics.mean(avg_task_times) > 60:  # More than 1 minute average
+        if task_time_count and task_time_sum / task_time_count > 60:  # More than 1 minute average
             recommendations["performance_issues"].append(
                 "Average task processing time is high"
             )
@@ -328,7 +504,7 @@ class WorkerCoordinator:
                 "Consider optimizing task processing logic"
             )
         
-        if len(set(metrics.health_status for metrics in self._worker_metrics.values())) > 1:
+        if sum(1 for count in health_counts.values() if count) > 1:
             recommendations["optimization_suggestions"].append(
                 "Worker performance is inconsistent - investigate resource allocation"
             )
@@ -343,53 +519,42 @@ class WorkerCoordinator:
             worker_info: Dictionary of current worker information
         """
         # Check if rebalancing is needed
-        queue_sizes = [len(queue) for queue in self._worker_queues.values()]
-        if not queue_sizes:
+        if not self._worker_queues:
             return
         
-        max_queue_size = max(queue_sizes)
-        min_queue_size = min(queue_sizes)
+        # (queue size, worker_id) in ascending order: the ends are the least
+        # and most loaded workers
+        queue_sizes = sorted((len(queue), worker_id) for worker_id, queue in self._worker_queues.items())
         
         # If difference is significant, rebalance
-        if max_queue_size - min_queue_size > 3:
+        if queue_sizes[-1][0] - queue_sizes[0][0] > 3:
             self.logger.info("Rebalancing workload across workers")
             
-            # Find overloaded and underloaded workers
-            overloaded_workers = [
-                worker_id for worker_id, queue in self._worker_queues.items()
-                if len(queue) > statistics.mean(queue_sizes) + 1
-            ]
-            
-            underloaded_workers = [
-                worker_id for worker_id, queue in self._worker_queues.items()
-                if len(queue) < statistics.mean(queue_sizes) - 1
-            ]
-            
-            # Move tasks from overloaded to underloaded workers
-            for overloaded_worker in overloaded_workers:
-                if not underloaded_workers:
-                    break
+            # Move tasks from the most to the least loaded worker until they are close
+            while queue_sizes[-1][0] - queue_sizes[0][0] > 3:
+                overloaded_size, overloaded_worker = queue_sizes.pop()
+                underloaded_size, underloaded_worker = queue_sizes.pop(0)
                 
-                overloaded_queue = self._worker_queues[overloaded_worker]
-                if len(overloaded_queue) > 1:
-                    # Move the last task (lowest priority) to an underloaded worker
-                    task_id = overloaded_queue.pop()
-                    underloaded_worker = underloaded_workers[0]
-                    self._worker_queues[underloaded_worker].append(task_id)
-                    self._worker_assignments[task_id] = underloaded_worker
-                    
-                    self.logger.debug(
-                        f"Moved task {task_id} from {overloaded_worker} to {underloaded_worker}"
-                    )
-                    
-                    # Update underloaded workers list
-                    if len(self._worker_queues[underloaded_worker]) >= statistics.mean(queue_sizes):
-                        underloaded_workers.remove(underloaded_worker)
+                # Move the last task (lowest priority) to the underloaded worker
+                task_id, _ = self._worker_queues[overloaded_worker].popitem()
+                self._worker_queues[underloaded_worker][task_id] = None
+                self._worker_assignments[task_id] = underloaded_worker
+                self._load_distribution[overloaded_worker] = overloaded_size - 1
+                self._load_distribution[underloaded_worker] = underloaded_size + 1
+                self._refresh_load_score(overloaded_worker)
+                self._refresh_load_score(underloaded_worker)
+                
+                self.logger.debug(
+                    f"Moved task {task_id} from {overloaded_worker} to {underloaded_worker}"
+                )
+                
+                bisect.insort(queue_sizes, (overloaded_size - 1, overloaded_worker))
+                bisect.insort(queue_sizes, (underloaded_size + 1, underloaded_worker))
             
             # Trigger rebalance callbacks
-            for callback in self._load_rebalance_callbacks:
+            for callback, is_coroutine in self._load_rebalance_callbacks:
                 try:
-                    if asyncio.iscoroutinefunction(callback):
+                    if is_coroutine:
                         await callback()
                     else:
                         callback()
@@ -398,60 +563,116 @@ class WorkerCoordinator:
     
     async def add_worker_failure_callback(self, callback: Callable):
         """Adds a callback for worker failure events."""
-        self._worker_failure_callbacks.append(callback)
+        self._worker_failure_callbacks.append((callback, asyncio.iscoroutinefunction(callback)))
     
     async def add_load_rebalance_callback(self, callback: Callable):
         """Adds a callback for load rebalancing events."""
-        self._load_rebalance_callbacks.append(callback)
+        self._load_rebalance_callbacks.append((callback, asyncio.iscoroutinefunction(callback)))
     
-    def get_worker_metrics(self) -> Dict[str, WorkerMetrics]:
-        """Returns current worker metrics."""
-        return self._worker_metrics.copy()
+    def get_worker_metrics(self) -> Mapping[str, WorkerMetrics]:
+        """Returns a live read-only view of current worker metrics."""
+        return self._metrics_view
     
-    def get_load_distribution(self) -> Dict[str, int]:
-        """Returns current load distribution across workers."""
-        return {
-            worker_id: len(queue) 
-            for worker_id, queue in self._worker_queues.items()
-        }
+    def get_load_distribution(self) -> Mapping[str, int]:
+        """Returns a live read-only view of the load distribution across workers."""
+        return self._load_distribution_view
     
-    async def _update_load_scores(
+    def _update_load_scores(
         self,
         available_workers: List[str],
         worker_info: Dict[str, WorkerInfo]
     ):
-        """Updates load scores for all available workers."""
+        """
+        Scores workers seen for the first time.
+        
+        Later changes reach the scores as events: queue, timing and health
+        changes through _refresh_load_score, status changes through
+        update_worker_status.
+        """
         for worker_id in available_workers:
-            score = 0.0
-            
-            # Factor 1: Current queue size (lower is better)
-            queue_size = len(self._worker_queues.get(worker_id, []))
-            score += queue_size * 10
-            
-            # Factor 2: Average processing time (lower is better)
-            if worker_id in self._worker_metrics:
-                metrics = self._worker_metrics[worker_id]
-                score += metrics.average_task_time
-                
-                # Factor 3: Error rate (lower is better)
-                score += metrics.consecutive_failures * 5
-                
-                # Factor 4: Health status
-                if metrics.health_status == HealthCheckStatus.UNHEALTHY:
-                    score += 100
-                elif metrics.health_status == HealthCheckStatus.DEGRADED:
-                    score += 20
+            if worker_id not in self._worker_statuses:
+                info = worker_info.get(worker_id)
+                self.update_worker_status(worker_id, info.status if info is not None else None)
+    
+    def update_worker_status(self, worker_id: str, status: Optional[WorkerStatus]):
+        """
+        Records a worker status change and rescores the worker.
+        
+        Args:
+            worker_id: ID of the worker whose status changed
+            status: The worker's new status
+        """
+        if worker_id in self._worker_statuses:
+            previous = self._worker_statuses[worker_id]
+            if previous == status:
+                return
+            self._status_counts[previous] -= 1
+        self._worker_statuses[worker_id] = status
+        self._status_counts[status] += 1
+        self._refresh_load_score(worker_id)
+    
+    def _compute_load_score(self, worker_id: str) -> float:
+        """Computes a worker's load score; lower is better."""
+        score = 0.0
+        
+        # Factor 1: Current queue size (lower is better)
+        queue_size = len(self._worker_queues.get(worker_id, ()))
+        score += queue_size * 10
+        
+        # Factor 2: Average processing time (lower is better)
+        if worker_id in self._worker_metrics:
+            metrics = self._worker_metrics[worker_id]
+            score += metrics.average_task_time
             
-            # Factor 5: Current worker status
-            if worker_id in worker_info:
-                if worker_info[worker_id].status == WorkerStatus.BUSY:
-                    score += 50
-                elif worker_info[worker_id].status == WorkerStatus.ERROR:
-                    score += 200
+            # Factor 3: Error rate (lower is better)
+            score += metrics.consecutive_failures * 5
             
-            self._load_scores[worker_id] = score
+            # Factor 4: Health status
+            if metrics.health_status == HealthCheckStatus.UNHEALTHY:
+                score += 100
+            elif metrics.health_status == HealthCheckStatus.DEGRADED:
+                score += 20
+        
+        # Factor 5: Current worker status
+        status = self._worker_statuses.get(worker_id)
+        if status == WorkerStatus.BUSY:
+            score += 50
+        elif status == WorkerStatus.ERROR:
+            score += 200
+        
+        return score
+    
+    def _refresh_load_score(self, worker_id: str):
+        """Recomputes a worker's load score and pushes it onto the heap if it changed."""
+        score = self._compute_load_score(worker_id)
+        if self._load_scores.get(worker_id) == score:
+            return
+        
+        self._load_scores[worker_id] = score
+        epoch = self._load_epoch[worker_id] = next(self._epoch_counter)
+        heapq.heappush(self._load_heap, (score, epoch, worker_id))
+        
+        # Drop stale entries once they outnumber the live ones by too much
+        if len(self._load_heap) > LOAD_HEAP_SLACK * len(self._load_epoch) + 64:
+            self._load_heap = [
+                (score, self._load_epoch[wid], wid) for wid, score in self._load_scores.items()
+            ]
+            heapq.heapify(self._load_heap)
     
-    async def _round_robin_assignment(self, available_workers: List[str]) -> LoadBalancingResult:
+    def _push_task_time(self, worker_id: str, average_task_time: float):
+        """Pushes a worker's new average task time onto the speed heap."""
+        heapq.heappush(self._speed_heap, (average_task_time, worker_id))
+        
+        # Drop stale entries once they outnumber the live ones by too much
+        if len(self._speed_heap) > LOAD_HEAP_SLACK * len(self._worker_metrics) + 64:
+            self._speed_heap = [
+                (metrics.average_task_time, wid)
+                for wid, metrics in self._worker_metrics.items()
+                if metrics.average_task_time > 0
+            ]
+            heapq.heapify(self._speed_heap)
+    
+    def _round_robin_assignment(self, available_workers: List[str]) -> LoadBalancingResult:
         """Assigns task using round-robin strategy."""
         selected_worker = available_workers[self._round_robin_index % len(available_workers)]
         self._round_robin_index += 1
@@ -459,45 +680,72 @@ class WorkerCoordinator:
         return LoadBalancingResult(
             selected_worker_id=selected_worker,
             reason="Round-robin selection",
-            load_scores=self._load_scores.copy(),
+            load_scores=self._load_scores_view,
             strategy_used=LoadBalancingStrategy.ROUND_ROBIN
         )
     
-    async def _least_loaded_assignment(self, available_workers: List[str]) -> LoadBalancingResult:
+    def _least_loaded_assignment(self, available_workers: List[str]) -> LoadBalancingResult:
         """Assigns task to least loaded worker."""
-        selected_worker = min(available_workers, key=lambda w: self._load_scores.get(w, float('inf')))
+        available = set(available_workers)
+        heap = self._load_heap
+        selected_worker = None
+        skipped = []
+        while heap:
+            score, epoch, worker_id = heap[0]
+            if self._load_epoch.get(worker_id) != epoch:
+                heapq.heappop(heap)  # superseded score
+            elif worker_id in available:
+                selected_worker = worker_id
+                break
+            else:
+                skipped.append(heapq.heappop(heap))
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        
+        # Workers that were never scored
+        if selected_worker is None:
+            selected_worker = min(available_workers, key=lambda w: self._load_scores.get(w, float('inf')))
         
         return LoadBalancingResult(
             selected_worker_id=selected_worker,
             reason=f"Lowest load score: {self._load_scores.get(selected_worker, 0):.1f}",
-            load_scores=self._load_scores.copy(),
+            load_scores=self._load_scores_view,
             strategy_used=LoadBalancingStrategy.LEAST_LOADED
         )
     
-    async def _fastest_worker_assignment(self, available_workers: List[str]) -> LoadBalancingResult:
+    def _fastest_worker_assignment(self, available_workers: List[str]) -> LoadBalancingResult:
         """Assigns task to fastest worker based on average processing time."""
+        available = set(available_workers)
+        heap = self._speed_heap
         fastest_worker = None
-        fastest_time = float('inf')
-        
-        for worker_id in available_workers:
-            if worker_id in self._worker_metrics:
-                avg_time = self._worker_metrics[worker_id].average_task_time
-                if avg_time > 0 and avg_time < fastest_time:
-                    fastest_time = avg_time
-                    fastest_worker = worker_id
+        fastest_time = 0.0
+        skipped = []
+        while heap:
+            avg_time, worker_id = heap[0]
+            metrics = self._worker_metrics.get(worker_id)
+            if metrics is None or metrics.average_task_time != avg_time:
+                heapq.heappop(heap)  # superseded average
+            elif worker_id in available:
+                fastest_worker = worker_id
+                fastest_time = avg_time
+                break
+            else:
+                skipped.append(heapq.heappop(heap))
+        for entry in skipped:
+            heapq.heappush(heap, entry)
         
         # Fallback to least loaded if no timing data available
         if fastest_worker is None:
-            return await self._least_loaded_assignment(available_workers)
+            return self._least_loaded_assignment(available_workers)
         
         return LoadBalancingResult(
             selected_worker_id=fastest_worker,
             reason=f"Fastest average time: {fastest_time:.2f}s",
-            load_scores=self._load_scores.copy(),
+            load_scores=self._load_scores_view,
             strategy_used=LoadBalancingStrategy.FASTEST_WORKER
         )
     
-    async def _priority_based_assignment(
+    def _priority_based_assignment(
         self,
         task_item: TaskItem,
         available_workers: List[str]
@@ -505,32 +753,51 @@ class WorkerCoordinator:
         """Assigns task based on priority and worker capabilities."""
         # For high priority tasks, use the fastest available worker
         if task_item.priority <= 1:  # High priority
-            return await self._fastest_worker_assignment(available_workers)
+            return self._fastest_worker_assignment(available_workers)
         else:
             # For normal/low priority tasks, use least loaded
-            return await self._least_loaded_assignment(available_workers)
+            return self._least_loaded_assignment(available_workers)
     
     async def _health_monitor_loop(self):
-        """Background health monitoring loop."""
+        """
+        Background health monitoring loop.
+        
+        Each worker is checked every health_check_interval seconds on its own
+        schedule; the loop sleeps until the next worker is due.
+        """
+        deadlines = self._health_deadlines
         while self._is_monitoring:
             try:
-                current_time = datetime.utcnow()
+                current_ts = time.monotonic()
                 
-                # Update health status for all workers
-                for worker_id, metrics in self._worker_metrics.items():
+                # Check the workers that are due
+                while deadlines and deadlines[0][0] <= current_ts:
+                    _, registration, worker_id = heapq.heappop(deadlines)
+                    if self._registrations.get(worker_id) != registration:
+                        continue  # retired since this check was scheduled
+                    metrics = self._worker_metrics[worker_id]
+                    
                     # Check if worker has been inactive for too long
-                    if (metrics.last_health_check and 
-                        (current_time - metrics.last_health_check).seconds > self.worker_timeout):
-                        
-                        if metrics.health_status != HealthCheckStatus.UNHEALTHY:
-                            self.logger.warning(f"Worker {worker_id} health check timeout")
-                            metrics.health_status = HealthCheckStatus.UNHEALTHY
-                            await self._handle_unhealthy_worker(worker_id)
+                    timed_out = bool(
+                        metrics.last_health_check_ts and
+                        current_ts - metrics.last_health_check_ts > self.worker_timeout
+                    )
+                    
+                    # Update last health check and schedule the next one before
+                    # anything below can fail and drop the worker from the schedule
+                    metrics.last_health_check = datetime.utcnow()
+                    metrics.last_health_check_ts = current_ts
+                    heapq.heappush(deadlines, (current_ts + self.health_check_interval, registration, worker_id))
                     
-                    # Update last health check
-                    metrics.last_health_check = current_time
+                    if timed_out and metrics.health_status != HealthCheckStatus.UNHEALTHY:
+                        self.logger.warning(f"Worker {worker_id} health check timeout")
+                        self._set_health_status(worker_id, metrics, HealthCheckStatus.UNHEALTHY)
+                        await self._handle_unhealthy_worker(worker_id)
                 
-                await asyncio.sleep(self.health_check_interval)
+                if deadlines:
+                    await asyncio.sleep(max(deadlines[0][0] - time.monotonic(), 0))
+                else:
+                    await asyncio.sleep(self.health_check_interval)
                 
             except asyncio.CancelledError:
                 break
@@ -543,9 +810,9 @@ class WorkerCoordinator:
         self.logger.warning(f"Handling unhealthy worker: {worker_id}")
         
         # Trigger failure callbacks
-        for callback in self._worker_failure_callbacks:
+        for callback, is_coroutine in self._worker_failure_callbacks:
             try:
-                if asyncio.iscoroutinefunction(callback):
+                if is_coroutine:
                     await callback(worker_id)
                 else:
                     callback(worker_id)
@@ -553,24 +820,32 @@ class WorkerCoordinator:
                 self.logger.error(f"Error in worker failure callback: {e}")
         
         # Redistribute tasks from unhealthy worker
+        self._redistribute_tasks(worker_id)
+        self._refresh_load_score(worker_id)
+    
+    def _redistribute_tasks(self, worker_id: str):
+        """Moves a worker's queued tasks round-robin onto the healthy workers."""
         if worker_id in self._worker_queues and self._worker_queues[worker_id]:
-            tasks_to_redistribute = self._worker_queues[worker_id].copy()
+            tasks_to_redistribute = list(self._worker_queues[worker_id])
             self._worker_queues[worker_id].clear()
+            self._load_distribution[worker_id] = 0
             
             # Find healthy workers to redistribute tasks to
             healthy_workers = [
-                wid for wid, metrics in self._worker_metrics.items()
-                if metrics.health_status == HealthCheckStatus.HEALTHY and wid != worker_id
+                wid for wid in self._workers_by_health[HealthCheckStatus.HEALTHY] if wid != worker_id
             ]
             
             if healthy_workers:
                 for i, task_id in enumerate(tasks_to_redistribute):
                     target_worker = healthy_workers[i % len(healthy_workers)]
-                    self._worker_queues[target_worker].append(task_id)
+                    self._worker_queues[target_worker][task_id] = None
                     self._worker_assignments[task_id] = target_worker
+                    self._load_distribution[target_worker] += 1
                     
                     self.logger.debug(
                         f"Redistributed task {task_id} from {worker_id} to {target_worker}"
                     )
+                for target_worker in healthy_workers[:len(tasks_to_redistribute)]:
+                    self._refresh_load_score(target_worker)
             else:
                 self.logger.error("No healthy workers available for task redistribution")
\ No newline at end of file
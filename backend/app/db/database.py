@@ -1,17 +1,15 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from backend.app.core.config import settings
 
 
 def convert_db_url_for_asyncpg(url: str) -> str:
-    url = url.replace("postgresql://", "postgresql+asyncpg://")
-    parsed = urlparse(url)
-    query_params = parse_qs(parsed.query)
-    query_params.pop('sslmode', None)
-    new_query = urlencode(query_params, doseq=True)
-    new_parsed = parsed._replace(query=new_query)
-    return urlunparse(new_parsed)
+    url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    # asyncpg does not accept libpq's sslmode; drop it and keep the other
+    # query parameters exactly as given
+    base, _, query = url.partition("?")
+    params = [p for p in query.split("&") if p and not p.startswith("sslmode=")]
+    return f"{base}?{'&'.join(params)}" if params else base
 
 
 DATABASE_URL = convert_db_url_for_asyncpg(settings.DATABASE_URL)
@@ -21,6 +19,17 @@ engine = create_async_engine(
     echo=False,
     pool_pre_ping=True,
     pool_recycle=300,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=10,
+    # Hand out the most recently used connection so the warm ones (with
+    # their server-side prepared statements) get reused
+    pool_use_lifo=True,
+    connect_args={
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 1024,
+        "server_settings": {"jit": "off"},
+    },
 )
 
 async_session_maker = async_sessionmaker(
@@ -29,6 +38,14 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Sessions for read-only work: AUTOCOMMIT connections skip the BEGIN/COMMIT
+# round trips around each query. Shares the pool of the main engine.
+readonly_session_maker = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 class Base(DeclarativeBase):
     pass
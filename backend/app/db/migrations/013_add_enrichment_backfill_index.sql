@@ -0,0 +1,11 @@
+-- Migration 013: Index the users picked up by the startup enrichment backfill
+-- Partial index over users with no basic info, so each keyset page of the
+-- backfill is a range scan of matching rows only.
+-- Not built CONCURRENTLY: migrations run inside a transaction.
+
+CREATE INDEX IF NOT EXISTS idx_telegram_users_needs_enrichment
+ON telegram_users (id)
+WHERE username IS NULL
+  AND first_name IS NULL
+  AND is_deleted = FALSE
+  AND access_hash IS NOT NULL;
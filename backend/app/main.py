@@ -15,46 +15,140 @@ from backend.app.core.enhanced_logging_system import EnhancedLoggingSystem
 
 logger = get_logger("app")
 
+# Telegram accounts connected at the same time during auto-start
+ACCOUNT_CONNECT_CONCURRENCY = 10
+
+# Migration files from before schema_migrations existed. A database created
+# before tracking has already been through them, so on its first tracked
+# startup they are all marked applied without running.
+BASELINE_MIGRATIONS = (
+    "003_full_text_search.sql",
+    "004_database_integrity_constraints.sql",
+    "005_enhanced_database_constraints.sql",
+    "006_enhanced_media_tracking.sql",
+    "007_download_tasks_and_batch_processing.sql",
+    "008_fix_has_stories_field.sql",
+    "009_add_has_stories_column.sql",
+    "010_add_search_vectors.sql",
+    "011_fix_has_stories_default.sql",
+    "012_add_media_message_unique_constraint.sql",
+    "add_grouped_id.sql",
+    "add_last_photo_scan.sql",
+    "add_message_unique_constraint.sql",
+    "add_preview_retry_count.sql",
+    "add_profile_photo_history_fields.sql",
+)
+
+# Baseline files defining $$ functions. The old runner split them on ';', so
+# they never applied; a fresh database marks them applied as well and runs
+# the rest of the baseline.
+HELD_BACK_MIGRATIONS = (
+    "003_full_text_search.sql",
+    "004_database_integrity_constraints.sql",
+    "005_enhanced_database_constraints.sql",
+    "006_enhanced_media_tracking.sql",
+    "007_download_tasks_and_batch_processing.sql",
+    "010_add_search_vectors.sql",
+    "012_add_media_message_unique_constraint.sql",
+    "add_preview_retry_count.sql",
+)
+
+# Rarely used routers as (module, prefix under API_V1_STR, tags); imported and
+# included during startup instead of when this module is loaded
+LAZY_ROUTERS = [
+    ("backend.app.api.routes.correlation", "/correlation", ["correlation"]),
+    ("backend.app.api.routes.export", "/export", ["export"]),
+    ("backend.app.api.routes.member_scrape", "", ["member-scrape"]),
+    ("backend.app.api.routes.stories", "", ["stories"]),
+    ("backend.app.api.routes.profile_photos", "/profile-photos", ["profile-photos"]),
+    ("backend.app.api.routes.crawler", "/crawler", ["crawler"]),
+]
+
 # Initialize ConfigManager and EnhancedLoggingSystem
 config_manager = get_config_manager()
 enhanced_logger = EnhancedLoggingSystem(log_dir="logs")
 from backend.app.db.database import create_tables
 from backend.app.api.routes import auth, accounts, groups, stats, users, invites, detections
-from backend.app.api.routes import telegram, tasks, websocket, correlation, export
+from backend.app.api.routes import telegram, tasks, websocket
 from backend.app.api.routes import settings as settings_routes
 from backend.app.api.routes import media as media_routes
-from backend.app.api.routes import member_scrape as member_scrape_routes
-from backend.app.api.routes import stories as stories_routes
 from backend.app.services.task_queue import task_queue
 from backend.app.services.telegram_service import telegram_manager
 from backend.app.services.detection_service import detection_service
-from backend.app.db.database import async_session_maker
+from backend.app.db.database import async_session_maker, engine
+
+
+def _read_migrations(migrations_dir: str, applied: set) -> list:
+    """Returns (filename, sql) for each pending migration file."""
+    migrations = []
+    for filename in sorted(os.listdir(migrations_dir)):
+        if not filename.endswith(".sql") or filename in applied:
+            continue
+        
+        filepath = os.path.join(migrations_dir, filename)
+        with open(filepath, 'r') as f:
+            migrations.append((filename, f.read()))
+    return migrations
 
 
-async def run_pending_migrations():
+async def schema_exists() -> bool:
+    """Returns whether the application tables already exist in the database."""
+    from sqlalchemy import text
+    async with engine.connect() as conn:
+        result = await conn.execute(text("SELECT to_regclass('telegram_messages') IS NOT NULL"))
+        return bool(result.scalar())
+
+
+async def run_pending_migrations(existing_schema: bool):
+    """
+    Applies the SQL files in db/migrations that have not been applied yet.
+    
+    Applied files are recorded in schema_migrations, which is read once up
+    front. On the first tracked startup it is seeded with BASELINE_MIGRATIONS
+    when existing_schema is set (the tables predate create_tables), otherwise
+    with HELD_BACK_MIGRATIONS only. All files run in one transaction with a
+    savepoint each, so a file that fails is rolled back on its own and
+    retried on the next startup.
+    Files are listed and read in a worker thread to keep the event loop free.
+    
+    Each file is sent as one script over asyncpg's simple query protocol: one
+    round trip per file, no per-statement PREPARE, and function bodies with
+    semicolons inside $$ quotes stay intact.
+    """
     migrations_dir = os.path.join(os.path.dirname(__file__), "db", "migrations")
-    if os.path.exists(migrations_dir):
+    if await asyncio.to_thread(os.path.exists, migrations_dir):
         from sqlalchemy import text
-        async with async_session_maker() as db:
-            for filename in sorted(os.listdir(migrations_dir)):
-                if filename.endswith(".sql"):
-                    filepath = os.path.join(migrations_dir, filename)
-                    with open(filepath, 'r') as f:
-                        lines = f.readlines()
-                    
-                    sql_lines = [line for line in lines if not line.strip().startswith('--')]
-                    sql_content = ''.join(sql_lines)
-                    
-                    try:
-                        for statement in sql_content.split(';'):
-                            statement = statement.strip()
-                            if statement:
-                                await db.execute(text(statement))
-                        await db.commit()
-                        logger.info(f"Applied migration: {filename}")
-                    except Exception as e:
-                        logger.debug(f"Migration {filename} skipped (already applied or error): {e}")
-                        await db.rollback()
+        async with engine.begin() as conn:
+            await conn.execute(text(
+                "CREATE TABLE IF NOT EXISTS schema_migrations ("
+                "filename VARCHAR(255) PRIMARY KEY, "
+                "applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+            ))
+            result = await conn.execute(text("SELECT filename FROM schema_migrations"))
+            applied = set(result.scalars().all())
+            
+            # First run with migration tracking: record the baseline as applied
+            if not applied:
+                baseline = BASELINE_MIGRATIONS if existing_schema else HELD_BACK_MIGRATIONS
+                await conn.execute(
+                    text("INSERT INTO schema_migrations (filename) VALUES (:filename)"),
+                    [{"filename": filename} for filename in baseline]
+                )
+                applied.update(baseline)
+            raw_connection = await conn.get_raw_connection()
+            
+            migrations = await asyncio.to_thread(_read_migrations, migrations_dir, applied)
+            for filename, sql_content in migrations:
+                try:
+                    async with conn.begin_nested():
+                        await raw_connection.driver_connection.execute(sql_content)
+                        await conn.execute(
+                            text("INSERT INTO schema_migrations (filename) VALUES (:filename)"),
+                            {"filename": filename}
+                        )
+                    logger.info(f"Applied migration: {filename}")
+                except Exception as e:
+                    logger.warning("Migration %s failed and will be retried on next startup: %s", filename, e)
 
 
 async def log_startup_configurations():
@@ -102,13 +196,31 @@ async def log_startup_configurations():
         pass
 
 
+def _include_lazy_routers(app: FastAPI):
+    """Imports the routers in LAZY_ROUTERS and adds them to the app, once."""
+    if getattr(app.state, "lazy_routers_included", False):
+        return
+    app.state.lazy_routers_included = True
+    
+    from importlib import import_module
+    for module_path, prefix, tags in LAZY_ROUTERS:
+        module = import_module(module_path)
+        app.include_router(module.router, prefix=f"{app_settings.API_V1_STR}{prefix}", tags=tags)
+    
+    # Regenerate the OpenAPI schema with the new routes
+    app.openapi_schema = None
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Initialize enhanced logging system
     await enhanced_logger.initialize()
     
+    # Checked before create_tables, which would make every database look existing
+    existing_schema = await schema_exists()
     await create_tables()
-    await run_pending_migrations()
+    _include_lazy_routers(app)
+    await run_pending_migrations(existing_schema)
     os.makedirs(app_settings.MEDIA_PATH, exist_ok=True)
     await task_queue.start()
     
@@ -118,10 +230,9 @@ async def lifespan(app: FastAPI):
     # Log all loaded configurations (with sensitive values masked)
     await log_startup_configurations()
     
-    # Store background tasks to keep them alive
-    app.state.background_tasks = []
-    
-    asyncio.create_task(_auto_start_monitors(app))
+    # Store background tasks to keep them alive; they are cancelled and
+    # awaited on shutdown
+    app.state.background_tasks = [asyncio.create_task(_auto_start_monitors(app))]
     
     yield
     
@@ -129,18 +240,28 @@ async def lifespan(app: FastAPI):
     await task_queue.stop()
     
     # Stop passive enrichment service
-    try:
-        from backend.app.services.passive_enrichment_service import passive_enrichment_service
-        await passive_enrichment_service.stop()
-    except:
-        pass
+    if hasattr(app.state, "passive_enrichment_service"):
+        try:
+            await app.state.passive_enrichment_service.stop()
+        except Exception as e:
+            logger.error(f"Failed to stop passive enrichment service: {e}")
     
     # Stop media retry service
-    try:
-        from backend.app.services.media_retry_service import media_retry_service
-        await media_retry_service.stop()
-    except:
-        pass
+    if hasattr(app.state, "media_retry_service"):
+        try:
+            await app.state.media_retry_service.stop()
+        except Exception as e:
+            logger.error(f"Failed to stop media retry service: {e}")
+    
+    # Cancel whatever is still running and wait for it, so no task is left
+    # pending with a database connection checked out
+    background_tasks = [task for task in app.state.background_tasks if task is not None]
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    
+    # Close the pooled database connections
+    await engine.dispose()
 
 
 async def _auto_start_monitors(app):
@@ -153,94 +274,97 @@ async def _auto_start_monitors(app):
     try:
         async with async_session_maker() as db:
             result = await db.execute(
-                select(TelegramAccount).where(TelegramAccount.status == "active")
+                select(TelegramAccount.id, TelegramAccount.phone).where(TelegramAccount.status == "active")
             )
-            accounts = result.scalars().all()
-            
-            for account in accounts:
+            accounts = result.all()
+        
+        # Connect accounts concurrently, each on its own session since an
+        # AsyncSession must not be shared between tasks
+        connect_semaphore = aio.Semaphore(ACCOUNT_CONNECT_CONCURRENCY)
+        
+        async def connect(account):
+            async with connect_semaphore:
                 try:
-                    await telegram_manager.connect_account(account.id, db)
+                    async with async_session_maker() as account_db:
+                        await telegram_manager.connect_account(account.id, account_db)
                     logger.info(f"Connected account {account.id} ({account.phone})")
                 except Exception as e:
                     logger.error(f"Failed to connect account {account.id}: {e}")
         
+        await aio.gather(*(connect(account) for account in accounts))
+        
         await telegram_manager.live_monitor.start_all_enabled()
         
         started = await telegram_manager.backfill_service.start_all_pending_backfills()
         logger.info(f"Auto-started {started} pending backfills")
         
         from backend.app.services.story_monitor import story_monitor
-        await story_monitor.start(telegram_manager)
-        logger.info("Story monitor started")
-        
         from backend.app.services.member_scrape_scheduler import init_member_scrape_scheduler
-        member_scheduler = init_member_scrape_scheduler(telegram_manager)
-        await member_scheduler.start()
-        logger.info("Member scrape scheduler started")
-        
         from backend.app.services.autojoin_service import autojoin_service
-        await autojoin_service.start(telegram_manager)
-        logger.info("AutoJoin service started")
-        
         from backend.app.services.profile_photo_scanner import profile_photo_scanner
-        await profile_photo_scanner.start(telegram_manager)
-        logger.info("Profile photo scanner started")
+        member_scheduler = init_member_scrape_scheduler(telegram_manager)
         
-        # Start user enricher worker for automatic user enrichment
-        from backend.app.services.user_enricher import user_enricher
-        try:
-            await user_enricher.start_worker()
-            logger.info("User enricher worker started")
-            
-            # Queue existing users for enrichment (only those without basic info)
-            await aio.sleep(5)  # Wait for worker to fully start
-            await _queue_existing_users_for_enrichment()
-        except Exception as enricher_error:
-            logger.error(f"Failed to start user enricher worker: {enricher_error}")
-            # Continue with application startup even if enricher fails
+        # The services are independent of each other, so start them together
+        starters = {
+            "Story monitor": story_monitor.start(telegram_manager),
+            "Member scrape scheduler": member_scheduler.start(),
+            "AutoJoin service": autojoin_service.start(telegram_manager),
+            "Profile photo scanner": profile_photo_scanner.start(telegram_manager),
+            "User enricher worker": _start_user_enricher(),
+        }
         
         # Start passive enrichment service for continuous background enrichment
-        passive_enabled = config_manager.get_bool("PASSIVE_ENRICHMENT_ENABLED", True)
-        if passive_enabled:
-            from backend.app.services.passive_enrichment_service import passive_enrichment_service
-            try:
-                await aio.sleep(2)  # Wait for enricher to be ready
-                started = await passive_enrichment_service.start()
-                if started:
-                    logger.info("Passive enrichment service started")
-                    # Store reference in app state to keep it alive
-                    app.state.passive_enrichment_service = passive_enrichment_service
-                    app.state.background_tasks.append(passive_enrichment_service._task)
-                else:
-                    logger.warning("Failed to start passive enrichment service")
-            except Exception as passive_error:
-                logger.error(f"Failed to start passive enrichment service: {passive_error}")
-                import traceback
-                traceback.print_exc()
-                # Continue with application startup even if passive enrichment fails
+        if config_manager.get_bool("PASSIVE_ENRICHMENT_ENABLED", True):
+            starters["Passive enrichment service"] = _start_passive_enrichment(app)
         
         # Start media retry service for automatic media download retries
-        media_retry_enabled = config_manager.get_bool("MEDIA_RETRY_ENABLED", True)
-        if media_retry_enabled:
-            from backend.app.services.media_retry_service import media_retry_service
-            try:
-                await aio.sleep(1)  # Brief wait before starting
-                await media_retry_service.start()
-                logger.info("Media retry service started")
-                # Store reference in app state to keep it alive
-                app.state.media_retry_service = media_retry_service
-                if media_retry_service._task:
-                    app.state.background_tasks.append(media_retry_service._task)
-            except Exception as media_retry_error:
-                logger.error(f"Failed to start media retry service: {media_retry_error}")
-                import traceback
-                traceback.print_exc()
-                # Continue with application startup even if media retry fails
+        if config_manager.get_bool("MEDIA_RETRY_ENABLED", True):
+            starters["Media retry service"] = _start_media_retry(app)
+        
+        results = await aio.gather(*starters.values(), return_exceptions=True)
+        for name, result in zip(starters, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to start {name}: {result}")
+            elif result is not False:
+                logger.info(f"{name} started")
         
     except Exception as e:
         logger.error(f"Auto-start monitors failed: {e}")
 
 
+async def _start_user_enricher():
+    """Starts the user enricher worker and queues existing users for enrichment."""
+    from backend.app.services.user_enricher import user_enricher
+    await user_enricher.start_worker()
+    
+    # Queue existing users for enrichment (only those without basic info).
+    # The worker's queue takes items as soon as start_worker returns.
+    await _queue_existing_users_for_enrichment()
+
+
+async def _start_passive_enrichment(app) -> bool:
+    """Starts the passive enrichment service and keeps a reference to it."""
+    from backend.app.services.passive_enrichment_service import passive_enrichment_service
+    started = await passive_enrichment_service.start()
+    if started:
+        # Store reference in app state to keep it alive
+        app.state.passive_enrichment_service = passive_enrichment_service
+        app.state.background_tasks.append(passive_enrichment_service._task)
+    else:
+        logger.warning("Failed to start passive enrichment service")
+    return started
+
+
+async def _start_media_retry(app):
+    """Starts the media retry service and keeps a reference to it."""
+    from backend.app.services.media_retry_service import media_retry_service
+    await media_retry_service.start()
+    # Store reference in app state to keep it alive
+    app.state.media_retry_service = media_retry_service
+    if media_retry_service._task:
+        app.state.background_tasks.append(media_retry_service._task)
+
+
 async def _queue_existing_users_for_enrichment():
     """Queue existing users that need enrichment"""
     from backend.app.models.telegram_account import TelegramAccount
@@ -273,51 +397,39 @@ async def _queue_existing_users_for_enrichment():
                 logger.warning("No connected clients found for bulk enrichment")
                 return
             
-            # Query users without basic info in batches
-            batch_size = 100
-            offset = 0
+            # Stream users without basic info from one query, queueing a batch at a time.
+            # Limit to 5000 users per startup to avoid overwhelming the queue
+            max_users = 5000
             total_queued = 0
             
-            while True:
-                async with async_session_maker() as db:
-                    query = (
-                        select(TelegramUser)
-                        .where(
-                            (TelegramUser.username.is_(None)) & 
-                            (TelegramUser.first_name.is_(None)) &
-                            (TelegramUser.is_deleted == False) &
-                            (TelegramUser.access_hash.isnot(None))
-                        )
-                        .order_by(TelegramUser.id)
-                        .offset(offset)
-                        .limit(batch_size)
+            async with async_session_maker() as db:
+                query = (
+                    select(TelegramUser.telegram_id)
+                    .where(
+                        (TelegramUser.username.is_(None)) & 
+                        (TelegramUser.first_name.is_(None)) &
+                        (TelegramUser.is_deleted == False) &
+                        (TelegramUser.access_hash.isnot(None))
                     )
-                    
-                    result = await db.execute(query)
-                    users = result.scalars().all()
-                    
-                    if not users:
-                        break
-                    
-                    for user in users:
-                        await user_enricher.queue_enrichment(
-                            client=client,
-                            telegram_id=user.telegram_id,
-                            group_id=None,
-                            source="startup_bulk"
-                        )
-                        total_queued += 1
-                    
-                    offset += batch_size
+                    .order_by(TelegramUser.id)
+                    .limit(max_users)
+                    .execution_options(yield_per=500)
+                )
+                
+                telegram_ids = await db.stream_scalars(query)
+                async for batch in telegram_ids.partitions(500):
+                    await user_enricher.queue_enrichment_bulk(
+                        client,
+                        [(telegram_id, None, "startup_bulk") for telegram_id in batch]
+                    )
+                    total_queued += len(batch)
                     
                     # Log progress every 1000 users
                     if total_queued % 1000 == 0:
                         logger.info(f"Queued {total_queued} users for enrichment...")
-                    
-                    # Limit to 5000 users per startup to avoid overwhelming the queue
-                    if total_queued >= 5000:
-                        logger.info(f"Reached limit of 5000 users, stopping bulk queue")
-                        break
+            
+            if total_queued >= max_users:
+                logger.info(f"Reached limit of {max_users} users, stopping bulk queue")
             
             logger.info(f"Queued {total_queued} existing users for enrichment")
     
@@ -351,23 +463,13 @@ app.include_router(stats.router, prefix=f"{app_settings.API_V1_STR}/stats", tags
 app.include_router(detections.router, prefix=f"{app_settings.API_V1_STR}/detections", tags=["detections"])
 app.include_router(telegram.router, prefix=f"{app_settings.API_V1_STR}/telegram", tags=["telegram"])
 app.include_router(tasks.router, prefix=f"{app_settings.API_V1_STR}/tasks", tags=["tasks"])
-app.include_router(correlation.router, prefix=f"{app_settings.API_V1_STR}/correlation", tags=["correlation"])
-app.include_router(export.router, prefix=f"{app_settings.API_V1_STR}/export", tags=["export"])
 app.include_router(websocket.router, tags=["websocket"])
 app.include_router(settings_routes.router, prefix=f"{app_settings.API_V1_STR}/settings", tags=["settings"])
 app.include_router(media_routes.router, prefix=f"{app_settings.API_V1_STR}/media", tags=["media"])
-app.include_router(member_scrape_routes.router, prefix=f"{app_settings.API_V1_STR}", tags=["member-scrape"])
-app.include_router(stories_routes.router, prefix=f"{app_settings.API_V1_STR}", tags=["stories"])
 
 from backend.app.api.routes import search as search_routes
 app.include_router(search_routes.router, prefix=f"{app_settings.API_V1_STR}/search", tags=["search"])
 
-from backend.app.api.routes import profile_photos as profile_photos_routes
-app.include_router(profile_photos_routes.router, prefix=f"{app_settings.API_V1_STR}/profile-photos", tags=["profile-photos"])
-
-from backend.app.api.routes import crawler as crawler_routes
-app.include_router(crawler_routes.router, prefix=f"{app_settings.API_V1_STR}/crawler", tags=["crawler"])
-
 
 app.mount("/media", StaticFiles(directory=app_settings.MEDIA_PATH), name="media")
 
@@ -40,8 +40,9 @@ class TelegramAccountManager:
         self._live_monitor = None
         self._db_session_maker = None
         
-        # Initialize session recovery manager
-        self.session_recovery = SessionRecoveryManager()
+        # Initialize session recovery manager; the only one that reconnects
+        # disconnected accounts from its health monitor
+        self.session_recovery = SessionRecoveryManager(auto_recover=True)
         
         # Start health monitoring
         asyncio.create_task(self._initialize_session_monitoring())
@@ -312,6 +313,7 @@ class TelegramAccountManager:
                 })
             
             self._dialogs_cache[account_id] = (dialogs, now)
+            self.session_recovery.mark_success(account_id)
             
             if entities_to_download:
                 asyncio.create_task(self._download_dialog_photos(account_id, client, entities_to_download, dialogs))
@@ -589,6 +591,7 @@ class TelegramAccountManager:
         
         try:
             message = await client.get_messages(chat_id, ids=message_id)
+            self.session_recovery.mark_success(account_id)
             if not message or not message.media:
                 return {"success": False, "error": "No media in message"}
             
@@ -2,7 +2,7 @@ import asyncio
 import os
 import hashlib
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 from telethon import TelegramClient
 from telethon.tl.functions.users import GetFullUserRequest
 from telethon.tl.functions.stories import GetPeerStoriesRequest
@@ -80,6 +80,24 @@ class UserEnricherService:
         
         self.logger.debug(f"[UserEnricher] Queued user {telegram_id} from {source}, queue size: {queue_size + 1}")
     
+    async def queue_enrichment_bulk(
+        self,
+        client: TelegramClient,
+        items: Iterable[Tuple[int, Optional[int], str]]
+    ) -> int:
+        """Queues (telegram_id, group_id, source) items in one call; returns how many were queued."""
+        queued = 0
+        for telegram_id, group_id, source in items:
+            # Same filtering as queue_enrichment
+            if telegram_id < 0 or telegram_id in self._processed_users:
+                continue
+            self._enrichment_queue.put_nowait((client, telegram_id, group_id, source))
+            queued += 1
+        
+        self._stats["users_queued"] += queued
+        self.logger.debug(f"[UserEnricher] Bulk queued {queued} users, queue size: {self._enrichment_queue.qsize()}")
+        return queued
+    
     async def _enrichment_worker(self):
         self.logger.info("[UserEnricher] Worker loop started")
         idle_log_interval = 60  # Log idle state every 60 seconds
@@ -0,0 +1,44 @@
+"""
+Unit tests for DuplicateDetector.
+
+Tests cover:
+- Hamming distance on raw hash bytes
+- Perceptual hash comparison on hex strings
+"""
+
+import pytest
+
+from backend.app.core.duplicate_detector import DuplicateDetector, SimilarityLevel
+
+
+class TestDuplicateDetector:
+    """Test suite for DuplicateDetector."""
+
+    @pytest.fixture
+    def detector(self):
+        """Create a DuplicateDetector instance."""
+        return DuplicateDetector()
+
+    @pytest.mark.parametrize("hash1,hash2,expected", [
+        (b"\x00" * 8, b"\x00" * 8, 0),
+        (b"\xff" * 8, b"\x00" * 8, 64),
+        (b"\x0f\x00", b"\x00\x01", 5),
+        (b"\xaa" * 32, b"\xbb" * 32, 64),
+    ])
+    def test_hamming(self, hash1, hash2, expected):
+        """Test that hamming counts differing bits across the whole hash."""
+        assert DuplicateDetector.hamming(hash1, hash2) == expected
+
+    @pytest.mark.asyncio
+    async def test_compare_perceptual_hashes(self, detector):
+        """Test hex hash comparison, including mismatched sizes and empty hashes."""
+        distance, level = await detector.compare_perceptual_hashes("ff00ff00ff00ff00", "ff00ff00ff00ff01")
+        assert distance == 1
+        assert level == SimilarityLevel.VERY_HIGH
+
+        distance, level = await detector.compare_perceptual_hashes("ff00ff00ff00ff00", "ff" * 32)
+        assert distance == float("inf")
+        assert level == SimilarityLevel.NONE
+
+        distance, level = await detector.compare_perceptual_hashes("", "ff00ff00ff00ff00")
+        assert level == SimilarityLevel.NONE
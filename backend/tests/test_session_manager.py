@@ -0,0 +1,124 @@
+"""
+Unit tests for SessionManager.
+
+Tests cover:
+- Result caching in execute_with_retry
+- Batched operations in execute_many
+- Single-attempt fast path on a given session
+- Session reuse after rollback errors
+"""
+
+import pytest
+
+from backend.app.core.session_manager import SessionManager, SessionRecoveryError
+
+
+class TestSessionManager:
+    """Test suite for SessionManager."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a SessionManager instance."""
+        return SessionManager()
+
+    @pytest.mark.asyncio
+    async def test_cached_result_skips_operation(self, manager):
+        """Test that a cached result is returned without running the operation again."""
+        calls = []
+
+        async def operation(session):
+            calls.append(session)
+            return len(calls)
+
+        first = await manager.execute_with_retry(operation, readonly=True, cache_key="k", cache_ttl=60)
+        second = await manager.execute_with_retry(operation, readonly=True, cache_key="k", cache_ttl=60)
+
+        assert first == second == 1
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_rerun(self, manager):
+        """Test that invalidate drops the cached result and uncached calls always run."""
+        calls = []
+
+        async def operation(session):
+            calls.append(session)
+            return len(calls)
+
+        await manager.execute_with_retry(operation, readonly=True, cache_key="k", cache_ttl=60)
+        manager.invalidate("k")
+        assert await manager.execute_with_retry(operation, readonly=True, cache_key="k", cache_ttl=60) == 2
+
+        # No TTL means no caching
+        assert await manager.execute_with_retry(operation, readonly=True, cache_key="k") == 3
+        assert await manager.execute_with_retry(operation, readonly=True) == 4
+
+    @pytest.mark.asyncio
+    async def test_execute_many_shares_session(self, manager):
+        """Test that execute_many runs every operation in order on one session."""
+        seen = []
+
+        def make_operation(value):
+            async def operation(session):
+                seen.append(session)
+                return value
+            return operation
+
+        results = await manager.execute_many([make_operation(i) for i in range(3)], readonly=True)
+
+        assert results == [0, 1, 2]
+        assert len(seen) == 3
+        assert seen[0] is seen[1] is seen[2]
+
+    @pytest.mark.asyncio
+    async def test_single_attempt_on_given_session(self, manager):
+        """Test that max_retries=0 with a session runs once and wraps failures."""
+        session = await manager.create_session(readonly=True)
+        calls = []
+
+        async def operation(s):
+            calls.append(s)
+            return "ok"
+
+        async def failing(s):
+            calls.append(s)
+            raise ValueError("boom")
+
+        try:
+            assert await manager.execute_with_retry(operation, max_retries=0, session=session) == "ok"
+            with pytest.raises(SessionRecoveryError):
+                await manager.execute_with_retry(failing, max_retries=0, session=session)
+        finally:
+            await session.close()
+
+        assert calls == [session, session]
+
+    @pytest.mark.asyncio
+    async def test_rollback_error_reuses_session(self, manager):
+        """Test that a session is kept after a successful rollback and replaced after a failed one."""
+        from sqlalchemy.exc import PendingRollbackError
+
+        class FakeSession:
+            def __init__(self, rollback_fails=False):
+                self.info = {}
+                self.rollback_fails = rollback_fails
+                self.closed = False
+
+            async def rollback(self):
+                if self.rollback_fails:
+                    raise RuntimeError("connection lost")
+
+            async def close(self):
+                self.closed = True
+
+        session = FakeSession()
+        error = PendingRollbackError("pending")
+        assert await manager.handle_rollback_error(session, error) is session
+        assert await manager.handle_rollback_error(session, error) is session
+        assert session.info['retry_gen'] == 2
+
+        broken = FakeSession(rollback_fails=True)
+        replacement = await manager.handle_rollback_error(broken, error)
+        assert replacement is not broken
+        assert broken.closed
+        await replacement.close()
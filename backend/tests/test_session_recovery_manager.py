@@ -0,0 +1,131 @@
+"""
+Unit tests for SessionRecoveryManager.
+
+Tests cover:
+- Cached, single-flight authorization probes
+- Single-flight reconnection
+- Automatic recovery of disconnected accounts only
+- Session statistics counters
+- Bounded session status tracking
+"""
+
+import asyncio
+
+import pytest
+
+from backend.app.core import session_recovery_manager
+from backend.app.core.session_recovery_manager import SessionHealth, SessionRecoveryManager
+
+
+class FakeClient:
+    """Minimal stand-in for a connected TelegramClient."""
+
+    def __init__(self, authorized=True):
+        self.authorized = authorized
+        self.auth_calls = 0
+
+    def is_connected(self):
+        return True
+
+    async def is_user_authorized(self):
+        self.auth_calls += 1
+        await asyncio.sleep(0)
+        return self.authorized
+
+
+class TestSessionRecoveryManager:
+    """Test suite for SessionRecoveryManager."""
+
+    @pytest.fixture
+    def manager(self):
+        """Create a SessionRecoveryManager instance."""
+        return SessionRecoveryManager()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_auth_probes_share_one_call(self, manager):
+        """Test that concurrent and repeated authorization checks hit the client once."""
+        client = FakeClient()
+
+        results = await asyncio.gather(*[manager._cached_is_authorized(1, client) for _ in range(5)])
+        assert results == [True] * 5
+        assert await manager._cached_is_authorized(1, client) is True
+        assert client.auth_calls == 1
+
+        # Dropping the cache entry forces a new probe
+        manager._auth_cache.pop(1)
+        assert await manager._cached_is_authorized(1, client) is True
+        assert client.auth_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reconnections_share_one_attempt(self, manager, monkeypatch):
+        """Test that concurrent reconnection requests for an account run one attempt."""
+        client = FakeClient()
+        attempts = []
+
+        async def reconnect(account_id):
+            attempts.append(account_id)
+            await asyncio.sleep(0.01)
+            return client
+
+        monkeypatch.setattr(manager, "_reconnect", reconnect)
+
+        results = await asyncio.gather(*[manager._attempt_reconnection(7) for _ in range(4)])
+
+        assert results == [client] * 4
+        assert attempts == [7]
+        assert manager._inflight_reconnects == {}
+
+    @pytest.mark.asyncio
+    async def test_statistics_follow_status_updates(self, manager):
+        """Test that the health distribution tracks status changes."""
+        await manager._update_session_status(1, SessionHealth.HEALTHY)
+        await manager._update_session_status(2, SessionHealth.HEALTHY)
+        await manager._update_session_status(3, SessionHealth.ERROR, "boom")
+        await manager._update_session_status(2, SessionHealth.DISCONNECTED, "gone")
+
+        stats = await manager.get_session_statistics()
+
+        assert stats["total_sessions"] == 3
+        assert stats["healthy_sessions"] == 1
+        assert stats["health_distribution"] == {
+            "healthy": 1,
+            "disconnected": 1,
+            "unauthorized": 0,
+            "rate_limited": 0,
+            "error": 1,
+            "unknown": 0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_least_recently_updated_status_is_evicted(self, manager, monkeypatch):
+        """Test that tracking stops at MAX_TRACKED_SESSIONS, dropping the stalest account."""
+        monkeypatch.setattr(session_recovery_manager, "MAX_TRACKED_SESSIONS", 2)
+
+        await manager._update_session_status(1, SessionHealth.HEALTHY)
+        await manager._update_session_status(2, SessionHealth.ERROR)
+        await manager._update_session_status(1, SessionHealth.HEALTHY)
+        await manager._update_session_status(3, SessionHealth.HEALTHY)
+
+        assert list(manager.session_status) == [1, 3]
+        stats = await manager.get_session_statistics()
+        assert stats["healthy_sessions"] == 2
+        assert stats["health_distribution"]["error"] == 0
+
+    @pytest.mark.asyncio
+    async def test_recovery_only_reconnects_disconnected_accounts(self, manager, monkeypatch):
+        """Test that accounts in error are not reconnected automatically."""
+        reconnected = []
+
+        async def bulk_reconnect(account_ids):
+            reconnected.extend(account_ids)
+            return {}
+
+        monkeypatch.setattr(manager, "_bulk_reconnect", bulk_reconnect)
+
+        await manager._update_session_status(1, SessionHealth.DISCONNECTED)
+        await manager._update_session_status(2, SessionHealth.ERROR, "Health check timeout")
+        await manager._update_session_status(3, SessionHealth.HEALTHY)
+        await manager.recover_all_disconnected()
+
+        assert reconnected == [1]
+        assert not manager.auto_recover
@@ -0,0 +1,171 @@
+"""
+Unit tests for WorkerCoordinator.
+
+Tests cover:
+- Windowed average task time
+- Least-loaded worker selection
+- Fastest worker selection
+- Queued completion reports
+- Workload rebalancing
+- Redistribution away from unhealthy workers
+- Worker retirement
+- Utilization from tracked worker statuses
+"""
+
+from datetime import datetime
+
+import pytest
+
+from backend.app.core.queue_types import TaskItem, TaskPriority, WorkerInfo, WorkerStatus
+from backend.app.core.worker_coordinator import TASK_TIME_WINDOW, HealthCheckStatus, WorkerCoordinator
+
+
+class TestWorkerCoordinator:
+    """Test suite for WorkerCoordinator."""
+
+    @pytest.fixture
+    def coordinator(self):
+        """Create a WorkerCoordinator with two registered workers."""
+        coordinator = WorkerCoordinator()
+        for worker_id in ("w1", "w2"):
+            coordinator._register_worker(worker_id)
+        return coordinator
+
+    @pytest.mark.asyncio
+    async def test_average_task_time_uses_recent_window(self, coordinator):
+        """Test that only the last TASK_TIME_WINDOW durations count toward the average."""
+        for i in range(TASK_TIME_WINDOW + 10):
+            await coordinator.report_task_completion(f"t{i}", "w1", True, float(i))
+
+        expected = sum(range(10, TASK_TIME_WINDOW + 10)) / TASK_TIME_WINDOW
+        assert coordinator.get_worker_metrics()["w1"].average_task_time == pytest.approx(expected)
+
+    @pytest.mark.asyncio
+    async def test_least_loaded_spreads_and_follows_status(self, coordinator):
+        """Test that assignments go to the lowest score and react to queue and status changes."""
+        def task(task_id):
+            return TaskItem(task_id=task_id, priority=TaskPriority.NORMAL, task_data=None, created_at=datetime.utcnow())
+
+        worker_info = {wid: WorkerInfo(worker_id=wid, status=WorkerStatus.IDLE) for wid in ("w1", "w2")}
+
+        first = await coordinator.assign_task(task("a"), ["w1", "w2"], worker_info)
+        second = await coordinator.assign_task(task("b"), ["w1", "w2"], worker_info)
+        assert {first.selected_worker_id, second.selected_worker_id} == {"w1", "w2"}
+
+        coordinator.update_worker_status("w1", WorkerStatus.BUSY)
+        third = await coordinator.assign_task(task("c"), ["w1", "w2"], worker_info)
+        assert third.selected_worker_id == "w2"
+
+        # Only w1 available: it is chosen even though w2 scores lower now
+        await coordinator.report_task_completion("c", "w2", True, 1.0)
+        fourth = await coordinator.assign_task(task("d"), ["w1"], worker_info)
+        assert fourth.selected_worker_id == "w1"
+
+    @pytest.mark.asyncio
+    async def test_fastest_worker_follows_current_averages(self, coordinator):
+        """Test that the fastest available worker is chosen from up-to-date averages."""
+        # No timing data yet: falls back to least loaded
+        assert coordinator._fastest_worker_assignment(["w1", "w2"]).strategy_used.value == "least_loaded"
+
+        await coordinator.report_task_completion("a", "w1", True, 1.0)
+        await coordinator.report_task_completion("b", "w2", True, 2.0)
+        assert coordinator._fastest_worker_assignment(["w1", "w2"]).selected_worker_id == "w1"
+        assert coordinator._fastest_worker_assignment(["w2"]).selected_worker_id == "w2"
+
+        # w1 slows down (average 5.5s) and w2 becomes the fastest
+        await coordinator.report_task_completion("c", "w1", True, 10.0)
+        assert coordinator._fastest_worker_assignment(["w1", "w2"]).selected_worker_id == "w2"
+
+    @pytest.mark.asyncio
+    async def test_queued_completions_applied_on_stop(self, coordinator):
+        """Test that nowait reports are queued and applied when coordination stops."""
+        coordinator._worker_queues["w1"] = dict.fromkeys(["a", "b"])
+        coordinator._load_distribution["w1"] = 2
+
+        coordinator.report_task_completion_nowait("a", "w1", True, 1.0)
+        coordinator.report_task_completion_nowait("b", "w1", False, 3.0)
+        assert coordinator.get_worker_metrics()["w1"].average_task_time == 0.0
+
+        await coordinator.stop_coordination()
+
+        metrics = coordinator.get_worker_metrics()["w1"]
+        assert metrics.average_task_time == pytest.approx(2.0)
+        assert metrics.consecutive_failures == 1
+        assert coordinator.get_load_distribution()["w1"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rebalance_evens_out_queues(self, coordinator):
+        """Test that rebalancing moves tasks until queue sizes are within three."""
+        coordinator._worker_queues["w1"] = dict.fromkeys(f"t{i}" for i in range(9))
+        coordinator._load_distribution["w1"] = 9
+
+        await coordinator.rebalance_workload({})
+
+        distribution = coordinator.get_load_distribution()
+        assert sum(distribution.values()) == 9
+        assert abs(distribution["w1"] - distribution["w2"]) <= 3
+        assert all(coordinator._worker_assignments[t] == "w2" for t in coordinator._worker_queues["w2"])
+
+    @pytest.mark.asyncio
+    async def test_failing_worker_hands_tasks_to_healthy_ones(self, coordinator):
+        """Test that repeated failures mark a worker unhealthy and move its queue."""
+        await coordinator.report_task_completion("warmup", "w2", True, 1.0)
+        coordinator._worker_queues["w1"] = dict.fromkeys(["a", "b", "c", "x"])
+        coordinator._load_distribution["w1"] = 4
+
+        for _ in range(coordinator.max_consecutive_failures):
+            await coordinator.report_task_completion("x", "w1", False, 1.0)
+
+        assert coordinator._workers_by_health[HealthCheckStatus.UNHEALTHY] == {"w1"}
+        assert coordinator._workers_by_health[HealthCheckStatus.HEALTHY] == {"w2"}
+        assert coordinator.get_load_distribution() == {"w1": 0, "w2": 3}
+
+    @pytest.mark.asyncio
+    async def test_start_retires_workers_left_out_of_the_pool(self, coordinator):
+        """Test that workers missing from a new pool are forgotten and their tasks moved."""
+        await coordinator.report_task_completion("warmup", "w2", True, 1.0)
+        await coordinator.report_task_completion("warmup", "w1", True, 1.0)
+        coordinator._worker_queues["w1"] = dict.fromkeys(["a", "b"])
+        coordinator._load_distribution["w1"] = 2
+        coordinator._worker_assignments.update(a="w1", b="w1")
+
+        await coordinator.start_coordination({"w2": WorkerInfo(worker_id="w2", status=WorkerStatus.IDLE)})
+        try:
+            assert "w1" not in coordinator.get_worker_metrics()
+            assert "w1" not in coordinator._performance_history
+            assert "w1" not in coordinator._task_completion_times
+            assert coordinator._workers_by_health[HealthCheckStatus.HEALTHY] == {"w2"}
+            assert "w1" not in coordinator.get_load_distribution()
+            assert set(coordinator._worker_assignments.values()) <= {"w2"}
+            assert coordinator._fastest_worker_assignment(["w1", "w2"]).selected_worker_id == "w2"
+        finally:
+            await coordinator.stop_coordination()
+
+    def test_reregistered_worker_ignores_stale_entries(self, coordinator):
+        """Test that a worker retired and registered again is not judged by its old heap entries."""
+        coordinator.update_worker_status("w1", WorkerStatus.IDLE)
+        coordinator.update_worker_status("w2", WorkerStatus.IDLE)
+
+        coordinator.retire_worker("w1")
+        coordinator._register_worker("w1")
+        coordinator.update_worker_status("w1", WorkerStatus.ERROR)
+
+        assert coordinator._least_loaded_assignment(["w1", "w2"]).selected_worker_id == "w2"
+        assert [entry[2] for entry in coordinator._health_deadlines].count("w1") == 2
+        assert sum(
+            1 for _, registration, worker_id in coordinator._health_deadlines
+            if coordinator._registrations.get(worker_id) == registration
+        ) == 2
+
+    @pytest.mark.asyncio
+    async def test_recommendations_use_tracked_statuses(self, coordinator):
+        """Test that utilization follows the statuses reported through update_worker_status."""
+        worker_info = {wid: WorkerInfo(worker_id=wid, status=WorkerStatus.IDLE) for wid in ("w1", "w2")}
+        for worker_id in worker_info:
+            coordinator.update_worker_status(worker_id, WorkerStatus.IDLE)
+        assert (await coordinator.get_worker_recommendations(worker_info))["scaling_recommendation"] == "maintain"
+
+        for worker_id in worker_info:
+            coordinator.update_worker_status(worker_id, WorkerStatus.BUSY)
+        assert (await coordinator.get_worker_recommendations(worker_info))["scaling_recommendation"] == "scale_up"
+        assert coordinator._status_counts[WorkerStatus.IDLE] == 0
@@ -0,0 +1,39 @@
+#!/bin/bash
+# Pretty-print a tab-separated TelegramVault log file with aligned columns
+#
+# Usage: scripts/view-log.sh [-f] [logs/app.log]
+#   -f  follow the file like tail -F (accepted before or after the file)
+
+set -e
+
+FOLLOW=0
+LOG_FILE=""
+for arg in "$@"; do
+    case "$arg" in
+        -f) FOLLOW=1 ;;
+        -*) echo "Unknown option: $arg" >&2; exit 2 ;;
+        *) LOG_FILE="$arg" ;;
+    esac
+done
+LOG_FILE="${LOG_FILE:-logs/app.log}"
+
+if [ ! -f "$LOG_FILE" ]; then
+    echo "Log file not found: $LOG_FILE" >&2
+    exit 1
+fi
+
+# Continuation lines (tracebacks) have no tabs and are printed unchanged
+ALIGN='BEGIN { FS = "\t" }
+NF < 5 { print; next }
+{
+    msg = $5
+    for (i = 6; i <= NF; i++) msg = msg "\t" $i
+    printf "%s | %-8s | %-25s | %-20s | %s\n", $1, $2, $3, $4, msg
+    fflush()
+}'
+
+if [ "$FOLLOW" = 1 ]; then
+    tail -F "$LOG_FILE" | awk "$ALIGN"
+else
+    awk "$ALIGN" "$LOG_FILE"
+fi